@@ -1,21 +1,74 @@
 __version__ = "0.1.0"
 
-from jiken.client import JikenClient
-from jiken.exceptions import (
-    JikenAPIError,
-    JikenAuthError,
-    JikenError,
-    JikenRequestError,
-)
-from jiken.models import SearchCondition, TradePrice, Transaction
+from importlib import import_module
+
+# Avoid importing typing at startup; type checkers treat this name specially
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from jiken.cache import ResponseCache
+    from jiken.client import JikenClient
+    from jiken.concurrency import AdaptiveLimiter
+    from jiken.currency import ExchangeRateTable
+    from jiken.exceptions import (
+        JikenAPIError,
+        JikenAuthError,
+        JikenError,
+        JikenRateLimitError,
+        JikenRequestError,
+        JikenTimeoutError,
+    )
+    from jiken.hedging import HedgePolicy
+    from jiken.models import SearchCondition, TradePrice, Transaction
+    from jiken.parser import Predicate
+
+# Public names are imported on first access, so reading cached models does not
+# pay for urllib/ssl (client) or multiprocessing (pipeline) at import time.
+_LAZY_ATTRIBUTES = {
+    "JikenClient": "jiken.client",
+    "ResponseCache": "jiken.cache",
+    "AdaptiveLimiter": "jiken.concurrency",
+    "ExchangeRateTable": "jiken.currency",
+    "HedgePolicy": "jiken.hedging",
+    "SearchCondition": "jiken.models",
+    "TradePrice": "jiken.models",
+    "Transaction": "jiken.models",
+    "Predicate": "jiken.parser",
+    "JikenError": "jiken.exceptions",
+    "JikenAuthError": "jiken.exceptions",
+    "JikenRequestError": "jiken.exceptions",
+    "JikenRateLimitError": "jiken.exceptions",
+    "JikenTimeoutError": "jiken.exceptions",
+    "JikenAPIError": "jiken.exceptions",
+}
 
 __all__ = [
     "JikenClient",
+    "ResponseCache",
+    "AdaptiveLimiter",
+    "ExchangeRateTable",
+    "HedgePolicy",
     "SearchCondition",
     "TradePrice",
     "Transaction",
+    "Predicate",
     "JikenError",
     "JikenAuthError",
     "JikenRequestError",
+    "JikenRateLimitError",
+    "JikenTimeoutError",
     "JikenAPIError",
 ]
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'jiken' has no attribute '{name}'")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
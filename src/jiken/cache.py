@@ -0,0 +1,263 @@
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+Loader = Callable[[dict[str, str]], dict[str, Any]]
+
+CacheKey = tuple[tuple[str, str], ...]
+
+
+@dataclass
+class _Entry:
+    data: dict[str, Any]
+    expires_at: float
+
+
+def _cache_key(params: dict[str, str]) -> CacheKey:
+    return tuple(sorted(params.items()))
+
+
+class ResponseCache:
+    """In-memory TTL cache of decoded API responses.
+
+    With ``stale_ttl`` set, an expired entry is still returned for that many
+    seconds after expiry while a background worker refreshes it
+    (stale-while-revalidate), so callers never wait for a hot query to be
+    refetched. Queries registered with keep_warm() are refreshed ahead of
+    expiry by a scheduler thread. All background refreshes share a bounded
+    thread pool, and at most one refresh per query runs at a time.
+
+    A failed background refresh keeps the stale entry; once it is older than
+    ``stale_ttl`` the next caller fetches synchronously and sees the error.
+    Concurrent callers missing the same query share a single load.
+
+    At most ``max_entries`` responses are kept: when the cache is full,
+    entries past their stale window are purged first, then the least
+    recently used ones.
+
+    Args:
+        ttl: Seconds a response stays fresh
+        stale_ttl: Seconds after expiry a stale response may still be served
+            (0 disables stale-while-revalidate)
+        prewarm_lead: Seconds before expiry at which warm queries are
+            refreshed (default: a tenth of ttl)
+        max_workers: Maximum number of background refresh threads
+        max_entries: Maximum number of cached responses
+        clock: Monotonic time source (default: time.monotonic)
+    """
+
+    def __init__(
+        self,
+        ttl: float = 3600.0,
+        *,
+        stale_ttl: float = 0.0,
+        prewarm_lead: float | None = None,
+        max_workers: int = 2,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl <= 0:
+            raise ValueError("TTL must be positive")
+
+        if stale_ttl < 0:
+            raise ValueError("Stale TTL must not be negative")
+
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self._ttl = ttl
+        self._stale_ttl = stale_ttl
+        self._prewarm_lead = prewarm_lead if prewarm_lead is not None else ttl / 10
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: dict[CacheKey, _Entry] = {}
+        # Loads in flight per query, synchronous and background alike
+        self._loading: dict[CacheKey, Future[dict[str, Any]]] = {}
+        self._warm: dict[CacheKey, tuple[dict[str, str], Loader]] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="jiken-refresh")
+        self._stop = threading.Event()
+        self._scheduler: threading.Thread | None = None
+
+    def __enter__(self) -> "ResponseCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def get(
+        self, params: dict[str, str], load: Loader, timeout: float | None = None
+    ) -> dict[str, Any]:
+        """Return the cached response for params, loading it if needed.
+
+        A load is shared by every caller missing the same query, so ``load``
+        should not carry a caller's time limit; pass it as ``timeout``
+        instead. A caller that stops waiting leaves the load running for the
+        others and for the cache.
+
+        Args:
+            params: Query parameters
+            load: Callable fetching and decoding the response
+            timeout: Seconds to wait for a load (None to wait until it ends)
+
+        Returns:
+            Decoded response data (fresh, or stale while being refreshed)
+
+        Raises:
+            TimeoutError: The load did not finish within timeout
+        """
+        key = _cache_key(params)
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                # Re-insert to keep _entries in least recently used order
+                self._entries[key] = entry
+
+        if entry is not None:
+            if now < entry.expires_at:
+                return entry.data
+            if now < entry.expires_at + self._stale_ttl:
+                self._refresh_async(key, params, load)
+                return entry.data
+
+        return self._load(key, params, load, timeout)
+
+    def keep_warm(self, params: dict[str, str], load: Loader) -> None:
+        """Keep a hot query refreshed ahead of expiry.
+
+        Starts the prewarm scheduler on first use.
+
+        Args:
+            params: Query parameters
+            load: Callable fetching and decoding the response
+        """
+        with self._lock:
+            self._warm[_cache_key(params)] = (params, load)
+            if self._scheduler is None:
+                self._scheduler = threading.Thread(
+                    target=self._run_scheduler, name="jiken-prewarm", daemon=True
+                )
+                self._scheduler.start()
+
+    def prewarm(self) -> list[Future[dict[str, Any]]]:
+        """Schedule refreshes of warm queries that are missing or about to expire.
+
+        Called periodically by the scheduler thread.
+
+        Returns:
+            Futures of the scheduled refreshes
+        """
+        now = self._clock()
+        with self._lock:
+            due = [
+                (key, params, load)
+                for key, (params, load) in self._warm.items()
+                if key not in self._entries
+                or self._entries[key].expires_at - now <= self._prewarm_lead
+            ]
+
+        futures = []
+        for key, params, load in due:
+            future = self._refresh_async(key, params, load)
+            if future is not None:
+                futures.append(future)
+        return futures
+
+    def invalidate(self, params: dict[str, str] | None = None) -> None:
+        """Drop one cached response, or all of them.
+
+        Args:
+            params: Query parameters of the entry to drop (None for all)
+        """
+        with self._lock:
+            if params is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(_cache_key(params), None)
+
+    def close(self) -> None:
+        """Stop the prewarm scheduler and background refreshes."""
+        self._stop.set()
+        if self._scheduler is not None:
+            self._scheduler.join()
+        self._executor.shutdown(cancel_futures=True)
+
+    def _load(
+        self, key: CacheKey, params: dict[str, str], load: Loader, timeout: float | None
+    ) -> dict[str, Any]:
+        with self._lock:
+            future = self._loading.get(key)
+            leader = future is None
+            if future is None:
+                future = self._loading[key] = Future()
+
+        if leader:
+            if timeout is None:
+                self._run_load(future, key, params, load)
+            else:
+                # Load on its own thread so this caller can give up waiting
+                threading.Thread(
+                    target=self._run_load,
+                    args=(future, key, params, load),
+                    name="jiken-load",
+                    daemon=True,
+                ).start()
+
+        return future.result(timeout)
+
+    def _run_load(
+        self, future: Future[dict[str, Any]], key: CacheKey, params: dict[str, str], load: Loader
+    ) -> None:
+        try:
+            future.set_result(self._refresh(key, params, load))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+
+    def _refresh(self, key: CacheKey, params: dict[str, str], load: Loader) -> dict[str, Any]:
+        data = load(params)
+        now = self._clock()
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = _Entry(data=data, expires_at=now + self._ttl)
+            if len(self._entries) > self._max_entries:
+                self._evict(now)
+        return data
+
+    def _evict(self, now: float) -> None:
+        # Called with the lock held
+        for key in [
+            key for key, entry in self._entries.items() if now >= entry.expires_at + self._stale_ttl
+        ]:
+            del self._entries[key]
+
+        while len(self._entries) > self._max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def _refresh_async(
+        self, key: CacheKey, params: dict[str, str], load: Loader
+    ) -> Future[dict[str, Any]] | None:
+        with self._lock:
+            if key in self._loading or self._stop.is_set():
+                return None
+            future = self._executor.submit(self._refresh, key, params, load)
+            self._loading[key] = future
+
+        def forget(_: Future[dict[str, Any]]) -> None:
+            with self._lock:
+                if self._loading.get(key) is future:
+                    del self._loading[key]
+
+        future.add_done_callback(forget)
+        return future
+
+    def _run_scheduler(self) -> None:
+        interval = max(self._prewarm_lead / 2, 0.01)
+        while not self._stop.wait(interval):
+            self.prewarm()
@@ -0,0 +1,235 @@
+import re
+import sys
+import unicodedata
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+@dataclass(frozen=True)
+class Category:
+    """Canonical categorical value with its labels in both response languages."""
+
+    code: int
+    """Language-independent code"""
+
+    ja: str
+    """Japanese label"""
+
+    en: str
+    """English label"""
+
+    def label(self, language: str) -> str:
+        """Label in a response language ("ja" or "en")."""
+        return self.ja if language == "ja" else self.en
+
+
+_SUFFIXES = (" prefecture", " metropolis", "-ken", "-fu", "-to", "-do")
+
+
+def _normalize(label: str) -> str:
+    # Fold width (ＲＣ -> RC), case and romanized prefecture suffixes
+    label = unicodedata.normalize("NFKC", label).strip().casefold()
+    for suffix in _SUFFIXES:
+        if label.endswith(suffix):
+            return label.removesuffix(suffix)
+    return label
+
+
+class Vocabulary:
+    """Canonical codes of one categorical field, looked up by label in either language.
+
+    Labels are matched exactly first, then ignoring width, case and
+    romanized prefecture suffixes ("Tokyo-to", "Osaka Prefecture").
+
+    Args:
+        categories: Known values of the field
+    """
+
+    def __init__(self, categories: Iterable[Category]) -> None:
+        self._by_code: dict[int, Category] = {}
+        self._by_label: dict[str, Category] = {}
+        for category in categories:
+            if category.code in self._by_code:
+                raise ValueError(f"Duplicate code: {category.code}")
+            self._by_code[category.code] = category
+            for label in (category.ja, category.en):
+                self._by_label[label] = category
+                self._by_label.setdefault(_normalize(label), category)
+
+    def __len__(self) -> int:
+        return len(self._by_code)
+
+    def __iter__(self) -> Iterator[Category]:
+        return iter(self._by_code.values())
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._by_code
+
+    def lookup(self, label: str | None) -> Category | None:
+        """Find the category of a label.
+
+        Args:
+            label: Label in either language
+
+        Returns:
+            Matching category, or None if the label is missing or unknown
+        """
+        if not label:
+            return None
+        category = self._by_label.get(label)
+        if category is None:
+            category = self._by_label.get(_normalize(label))
+        return category
+
+    def code(self, label: str | None) -> int | None:
+        """Canonical code of a label (None if the label is missing or unknown)."""
+        category = self.lookup(label)
+        return category.code if category is not None else None
+
+    def get(self, code: int | None) -> Category | None:
+        """Category of a code (None if the code is unknown)."""
+        return self._by_code.get(code) if code is not None else None
+
+    def label(self, code: int, language: str) -> str:
+        """Label of a code in a response language.
+
+        Args:
+            code: Canonical code
+            language: "ja" or "en"
+
+        Returns:
+            Label as returned by the API for that language
+
+        Raises:
+            ValueError: The code is unknown
+        """
+        category = self._by_code.get(code)
+        if category is None:
+            raise ValueError(f"Unknown code: {code}")
+        return category.label(language)
+
+    def intern(self, label: str | None) -> str | None:
+        """Return a shared instance of a label, so repeated values are stored once."""
+        if label is None:
+            return None
+        # _by_label also holds normalized keys, which must not rewrite the value
+        category = self._by_label.get(label)
+        if category is not None:
+            if label == category.ja:
+                return category.ja
+            if label == category.en:
+                return category.en
+        return sys.intern(label)
+
+
+# Codes follow JIS X 0401, the same codes as SearchCondition.area
+PREFECTURES = Vocabulary(
+    Category(code, ja, en)
+    for code, (ja, en) in enumerate(
+        [
+            ("北海道", "Hokkaido"),
+            ("青森県", "Aomori"),
+            ("岩手県", "Iwate"),
+            ("宮城県", "Miyagi"),
+            ("秋田県", "Akita"),
+            ("山形県", "Yamagata"),
+            ("福島県", "Fukushima"),
+            ("茨城県", "Ibaraki"),
+            ("栃木県", "Tochigi"),
+            ("群馬県", "Gunma"),
+            ("埼玉県", "Saitama"),
+            ("千葉県", "Chiba"),
+            ("東京都", "Tokyo"),
+            ("神奈川県", "Kanagawa"),
+            ("新潟県", "Niigata"),
+            ("富山県", "Toyama"),
+            ("石川県", "Ishikawa"),
+            ("福井県", "Fukui"),
+            ("山梨県", "Yamanashi"),
+            ("長野県", "Nagano"),
+            ("岐阜県", "Gifu"),
+            ("静岡県", "Shizuoka"),
+            ("愛知県", "Aichi"),
+            ("三重県", "Mie"),
+            ("滋賀県", "Shiga"),
+            ("京都府", "Kyoto"),
+            ("大阪府", "Osaka"),
+            ("兵庫県", "Hyogo"),
+            ("奈良県", "Nara"),
+            ("和歌山県", "Wakayama"),
+            ("鳥取県", "Tottori"),
+            ("島根県", "Shimane"),
+            ("岡山県", "Okayama"),
+            ("広島県", "Hiroshima"),
+            ("山口県", "Yamaguchi"),
+            ("徳島県", "Tokushima"),
+            ("香川県", "Kagawa"),
+            ("愛媛県", "Ehime"),
+            ("高知県", "Kochi"),
+            ("福岡県", "Fukuoka"),
+            ("佐賀県", "Saga"),
+            ("長崎県", "Nagasaki"),
+            ("熊本県", "Kumamoto"),
+            ("大分県", "Oita"),
+            ("宮崎県", "Miyazaki"),
+            ("鹿児島県", "Kagoshima"),
+            ("沖縄県", "Okinawa"),
+        ],
+        start=1,
+    )
+)
+
+PROPERTY_TYPES = Vocabulary(
+    [
+        Category(1, "宅地(土地)", "Residential Land(Land Only)"),
+        Category(2, "宅地(土地と建物)", "Residential Land(Land and Building)"),
+        Category(3, "中古マンション等", "Pre-owned Condominiums, etc."),
+        Category(4, "農地", "Agricultural Land"),
+        Category(5, "林地", "Forest Land"),
+    ]
+)
+
+# Single structures only; combined values such as "RC、W" have no code
+STRUCTURES = Vocabulary(
+    [
+        Category(1, "ＲＣ", "RC"),
+        Category(2, "ＳＲＣ", "SRC"),
+        Category(3, "鉄骨造", "S"),
+        Category(4, "木造", "W"),
+        Category(5, "軽量鉄骨造", "LS"),
+        Category(6, "ブロック造", "B"),
+    ]
+)
+
+
+_PERIOD_PATTERNS = (
+    # 2024Q1
+    re.compile(r"(?P<year>\d{4})\s*Q(?P<quarter>[1-4])"),
+    # 1st quarter 2024
+    re.compile(r"(?P<quarter>[1-4])(?:st|nd|rd|th)\s+quarter\s+(?P<year>\d{4})", re.IGNORECASE),
+    # 2024年第1四半期
+    re.compile(r"(?P<year>\d{4})年第(?P<quarter>[1-4])四半期"),
+)
+
+
+@lru_cache(maxsize=1024)
+def parse_period(period: str | None) -> tuple[int, int] | None:
+    """Parse a transaction period into year and quarter.
+
+    Args:
+        period: Period in any response language (e.g., "2024Q1",
+            "1st quarter 2024", "2024年第1四半期")
+
+    Returns:
+        (year, quarter), or None if the period is missing or not recognized
+    """
+    if not period:
+        return None
+
+    period = unicodedata.normalize("NFKC", period)
+    for pattern in _PERIOD_PATTERNS:
+        match = pattern.search(period)
+        if match is not None:
+            return int(match["year"]), int(match["quarter"])
+    return None
@@ -1,32 +1,222 @@
-import gzip
-import json
-from typing import Any
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from email.message import Message
+from email.utils import parsedate_to_datetime
+from functools import partial
+from typing import TYPE_CHECKING, Any, overload
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode
-from urllib.request import Request, urlopen
 
-from jiken.exceptions import JikenAPIError, JikenAuthError, JikenRequestError
-from jiken.models import SearchCondition, TradePrice, Transaction
+from jiken.concurrency import AdaptiveLimiter
+from jiken.exceptions import (
+    JikenAPIError,
+    JikenAuthError,
+    JikenRateLimitError,
+    JikenRequestError,
+    JikenTimeoutError,
+)
+from jiken.models import SearchCondition, Transaction
+from jiken.parser import (
+    Predicate,
+    decode_response,
+    parse_records,
+    parse_transaction_item,
+    parse_transactions,
+    records_from_columns,
+    transactions_from_columns,
+)
+from jiken.transport import Transport, TransportResponse, UrllibTransport
+
+if TYPE_CHECKING:
+    # Imported for annotations only, so the client does not load thread pools
+    from jiken.cache import ResponseCache
+    from jiken.hedging import HedgePolicy
+
+
+def _retry_after(headers: Message | None) -> float | None:
+    # Retry-After is either delay seconds or an HTTP date
+    value = headers.get("Retry-After") if headers is not None else None
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
 
 
 class JikenClient:
     _API_BASE_URL = "https://www.reinfolib.mlit.go.jp/ex-api/external/XIT001"
 
-    def __init__(self, api_key: str) -> None:
-        self._api_key = api_key
+    def __init__(
+        self,
+        api_key: str,
+        transport: Transport | None = None,
+        cache: "ResponseCache | None" = None,
+        timeout: float | None = 60.0,
+        hedge: "HedgePolicy | None" = None,
+    ) -> None:
+        """Create a client.
 
-    def search_transactions(self, condition: SearchCondition) -> list[Transaction]:
+        Args:
+            api_key: MLIT API subscription key
+            transport: Transport performing HTTP requests (default: urllib)
+            cache: Response cache used by search_transactions (default: none)
+            timeout: Seconds to wait for connecting and for each read of a
+                request (None to wait indefinitely)
+            hedge: Hedging policy duplicating slow requests (default: none)
+        """
+        self._api_key = api_key
+        self._transport = transport or UrllibTransport()
+        self._cache = cache
+        self._timeout = timeout
+        self._hedge = hedge
+
+    @overload
+    def search_transactions(
+        self,
+        condition: SearchCondition,
+        where: Iterable[Predicate] = (),
+        fields: None = None,
+        *,
+        deadline: float | None = None,
+    ) -> list[Transaction]: ...
+
+    @overload
+    def search_transactions(
+        self,
+        condition: SearchCondition,
+        where: Iterable[Predicate] = (),
+        *,
+        fields: Sequence[str],
+        deadline: float | None = None,
+    ) -> list[dict[str, Any]]: ...
+
+    def search_transactions(
+        self,
+        condition: SearchCondition,
+        where: Iterable[Predicate] = (),
+        fields: Sequence[str] | None = None,
+        *,
+        deadline: float | None = None,
+    ) -> list[Transaction] | list[dict[str, Any]]:
         """Search real estate transactions based on conditions.
 
         Args:
             condition: Search condition specifying year, area, quarter, etc.
+            where: Predicates evaluated on raw items before any conversion
+            fields: Transaction field names to return; when given, records are
+                dicts holding only these fields (transaction_price as int JPY)
+            deadline: Overall time budget in seconds for the request,
+                including connecting, reading and any hedge
 
         Returns:
             List of transaction records
+
+        Raises:
+            JikenTimeoutError: Request timed out or exceeded the deadline
         """
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
         params = self._build_params(condition)
-        response_data = self._fetch_data(params)
-        return self._parse_transactions(response_data)
+        response_data = self._fetch_data(params, deadline_at)
+        if fields is not None:
+            return parse_records(response_data, fields, tuple(where))
+        return self._parse_transactions(response_data, tuple(where))
+
+    @overload
+    def search_transactions_bulk(
+        self,
+        conditions: Iterable[SearchCondition],
+        where: Iterable[Predicate] = (),
+        fields: None = None,
+        *,
+        fetch_workers: int | None = None,
+        parse_workers: int | None = None,
+        max_pending: int | None = None,
+        limiter: AdaptiveLimiter | None = None,
+    ) -> Iterator[tuple[SearchCondition, list[Transaction]]]: ...
+
+    @overload
+    def search_transactions_bulk(
+        self,
+        conditions: Iterable[SearchCondition],
+        where: Iterable[Predicate] = (),
+        *,
+        fields: Sequence[str],
+        fetch_workers: int | None = None,
+        parse_workers: int | None = None,
+        max_pending: int | None = None,
+        limiter: AdaptiveLimiter | None = None,
+    ) -> Iterator[tuple[SearchCondition, list[dict[str, Any]]]]: ...
+
+    def search_transactions_bulk(
+        self,
+        conditions: Iterable[SearchCondition],
+        where: Iterable[Predicate] = (),
+        fields: Sequence[str] | None = None,
+        *,
+        fetch_workers: int | None = None,
+        parse_workers: int | None = None,
+        max_pending: int | None = None,
+        limiter: AdaptiveLimiter | None = None,
+    ) -> Iterator[tuple[SearchCondition, list[Transaction] | list[dict[str, Any]]]]:
+        """Search many conditions, overlapping network I/O with parsing.
+
+        Responses are fetched by a thread pool and decoded in a process pool,
+        so sockets and all CPU cores stay busy at the same time. Results are
+        yielded in completion order.
+
+        Args:
+            conditions: Search conditions to fetch
+            where: Predicates evaluated in the parser processes
+            fields: Transaction field names to return as dicts (see
+                search_transactions)
+            fetch_workers: Number of fetcher threads (default: 4, or the
+                limiter's max_limit)
+            parse_workers: Number of parser processes (default: CPU count)
+            max_pending: Maximum number of fetched responses not yet consumed
+                (default: twice fetch_workers)
+            limiter: Adaptive limiter tuning concurrency to latency and 429s
+
+        Returns:
+            Iterator of (condition, transactions) pairs
+        """
+        # Deferred: multiprocessing and concurrent.futures are only needed here
+        from jiken.pipeline import ParsePipeline
+
+        # Not hedged: the pipeline's threads and limiter govern concurrency
+        pipeline = ParsePipeline(
+            partial(self._fetch_raw, hedged=False),
+            fetch_workers=fetch_workers,
+            parse_workers=parse_workers,
+            max_pending=max_pending,
+            limiter=limiter,
+        )
+        results = pipeline.run(conditions, self._build_params, tuple(where), fields)
+        for condition, columns in results:
+            if fields is not None:
+                yield condition, records_from_columns(columns, fields)
+            else:
+                yield condition, transactions_from_columns(columns)
+
+    def keep_warm(self, conditions: Iterable[SearchCondition]) -> None:
+        """Refresh hot queries in the cache ahead of expiry.
+
+        Args:
+            conditions: Search conditions to keep warm
+
+        Raises:
+            ValueError: The client has no cache
+        """
+        if self._cache is None:
+            raise ValueError("keep_warm requires a client with a cache")
+
+        for condition in conditions:
+            self._cache.keep_warm(self._build_params(condition), self._load_data)
 
     def _build_params(self, condition: SearchCondition) -> dict[str, str]:
         """Build query parameters from search condition.
@@ -52,65 +242,128 @@ class JikenClient:
 
         return params
 
-    def _fetch_data(self, params: dict[str, str]) -> dict[str, Any]:
+    def _fetch_data(
+        self, params: dict[str, str], deadline_at: float | None = None
+    ) -> dict[str, Any]:
         """Fetch and decode gzip-compressed JSON from API.
 
         Args:
             params: Query parameters
+            deadline_at: time.monotonic() value by which the request must finish
+
+        Returns:
+            Parsed JSON response data
+
+        Raises:
+            JikenAuthError: Authentication failed (401)
+            JikenRequestError: Invalid request parameters (400)
+            JikenTimeoutError: Request timed out or exceeded the deadline
+            JikenAPIError: API error occurred
+        """
+        if self._cache is None:
+            return self._load_data(params, deadline_at)
+
+        # Cached loads are shared with other callers and background refreshes,
+        # so the deadline bounds only how long this caller waits for one
+        timeout = None
+        if deadline_at is not None:
+            timeout = deadline_at - time.monotonic()
+            if timeout <= 0:
+                raise JikenTimeoutError("Deadline exceeded before the request was sent")
+        try:
+            return self._cache.get(params, self._load_data, timeout)
+        except TimeoutError as e:
+            raise JikenTimeoutError("Deadline exceeded while waiting for the response") from e
+
+    def _load_data(
+        self, params: dict[str, str], deadline_at: float | None = None
+    ) -> dict[str, Any]:
+        """Fetch and decode a response from API, bypassing the cache.
+
+        Args:
+            params: Query parameters
+            deadline_at: time.monotonic() value by which the request must finish
 
         Returns:
             Parsed JSON response data
+        """
+        body, content_encoding = self._fetch_raw(params, deadline_at)
+        return decode_response(body, content_encoding)
+
+    def _fetch_raw(
+        self, params: dict[str, str], deadline_at: float | None = None, *, hedged: bool = True
+    ) -> tuple[bytes, str | None]:
+        """Fetch the raw response body from API without decoding it.
+
+        Args:
+            params: Query parameters
+            deadline_at: time.monotonic() value by which the request must finish
+            hedged: Hedge the request with the client's HedgePolicy, if any
+
+        Returns:
+            Tuple of (response body, Content-Encoding header value)
 
         Raises:
             JikenAuthError: Authentication failed (401)
             JikenRequestError: Invalid request parameters (400)
+            JikenRateLimitError: Too many requests (429)
+            JikenTimeoutError: Request timed out or exceeded the deadline
             JikenAPIError: API error occurred
         """
         url = f"{self._API_BASE_URL}?{urlencode(params)}"
 
-        request = Request(url)
-        request.add_header("Ocp-Apim-Subscription-Key", self._api_key)
+        headers = {"Ocp-Apim-Subscription-Key": self._api_key}
 
-        try:
-            with urlopen(request) as response:
-                data = response.read()
+        timeout = self._timeout
+        remaining = None
+        if deadline_at is not None:
+            remaining = deadline_at - time.monotonic()
+            if remaining <= 0:
+                raise JikenTimeoutError("Deadline exceeded before the request was sent")
+            timeout = remaining if timeout is None else min(timeout, remaining)
 
-                if response.headers.get("Content-Encoding") == "gzip":
-                    data = gzip.decompress(data)
+        def request() -> TransportResponse:
+            return self._transport.fetch(url, headers, timeout)
 
-                return json.loads(data.decode("utf-8"))
+        try:
+            hedge = self._hedge if hedged else None
+            response = hedge.run(request, remaining) if hedge is not None else request()
+            # Socket timeouts bound each read, not a response that keeps trickling in
+            if deadline_at is not None and time.monotonic() > deadline_at:
+                raise JikenTimeoutError("Deadline exceeded while reading the response")
+            return response.body, response.headers.get("Content-Encoding")
 
         except HTTPError as e:
             if e.code == 401:
                 raise JikenAuthError("Authentication failed. Check your API key.") from e
             elif e.code == 400:
                 raise JikenRequestError(f"Invalid request parameters: {e.reason}") from e
+            elif e.code == 429:
+                raise JikenRateLimitError(
+                    f"Rate limit exceeded: {e.reason}", _retry_after(e.headers)
+                ) from e
             else:
                 raise JikenAPIError(f"API error occurred (status {e.code}): {e.reason}") from e
         except URLError as e:
+            if isinstance(e.reason, TimeoutError):
+                raise JikenTimeoutError("Request timed out while connecting") from e
             raise JikenAPIError(f"Failed to connect to API: {e.reason}") from e
-        except (json.JSONDecodeError, UnicodeDecodeError) as e:
-            raise JikenAPIError("Failed to parse API response") from e
+        except TimeoutError as e:
+            raise JikenTimeoutError("Request timed out") from e
 
-    def _parse_transactions(self, data: dict[str, Any]) -> list[Transaction]:
+    def _parse_transactions(
+        self, data: dict[str, Any], where: Sequence[Predicate] = ()
+    ) -> list[Transaction]:
         """Parse API response data to Transaction objects.
 
         Args:
             data: API response data
+            where: Predicates items must match to be parsed
 
         Returns:
             List of Transaction objects
         """
-        transactions: list[Transaction] = []
-
-        if "data" not in data:
-            return transactions
-
-        for item in data["data"]:
-            transaction = self._parse_transaction_item(item)
-            transactions.append(transaction)
-
-        return transactions
+        return parse_transactions(data, where)
 
     def _parse_transaction_item(self, item: dict[str, Any]) -> Transaction:
         """Parse a single transaction item from API response.
@@ -121,35 +374,4 @@ class JikenClient:
         Returns:
             Transaction object
         """
-
-        def to_int(value: Any) -> int | None:
-            if value is None or value == "":
-                return None
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                return None
-
-        def to_float(value: Any) -> float | None:
-            if value is None or value == "":
-                return None
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return None
-
-        return Transaction(
-            transaction_price=TradePrice(amount_jpy=to_int(item.get("TradePrice")) or 0),
-            area=to_float(item.get("Area")) or 0.0,
-            unit_price=to_float(item.get("UnitPrice")),
-            prefecture=item.get("Prefecture", ""),
-            city=item.get("Municipality", ""),
-            district=item.get("DistrictName"),
-            building_year=to_int(item.get("BuildingYear")),
-            property_type=item.get("Type", ""),
-            structure=item.get("Structure"),
-            floor_area_ratio=to_float(item.get("FloorAreaRatio")),
-            building_coverage=to_float(item.get("CoverageRatio")),
-            frontage_road_width=to_float(item.get("Frontage")),
-            transaction_period=item.get("Period", ""),
-        )
+        return parse_transaction_item(item)
@@ -0,0 +1,158 @@
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+
+from jiken.exceptions import JikenAPIError
+
+
+class AdaptiveLimiter:
+    """Concurrency limit that adapts to observed latency and throttling (AIMD).
+
+    Every successful request whose latency stays within ``latency_tolerance``
+    times the baseline (the best latency seen, drifting slowly towards recent
+    samples) grows the limit additively by about one per limit's worth of
+    completions. A throttled or failed request
+    (429, 5xx, connection error) or a latency spike shrinks it
+    multiplicatively by ``backoff``. Requests that started before the last
+    decrease cannot trigger another one, so a single burst of errors backs
+    off only once.
+
+    The limiter is thread-safe; share one instance between all workers
+    calling the same API.
+
+    Args:
+        initial_limit: Starting number of concurrent requests
+        min_limit: Lower bound for the limit
+        max_limit: Upper bound for the limit
+        backoff: Factor applied to the limit on overload (0-1)
+        latency_tolerance: Latency ratio to the baseline treated as a spike
+        window: Length of the throughput measurement window (seconds)
+        clock: Monotonic time source (default: time.monotonic)
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        window: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+
+        if not 0 < backoff < 1:
+            raise ValueError("Backoff must be between 0 and 1")
+
+        if latency_tolerance <= 1:
+            raise ValueError("Latency tolerance must be greater than 1")
+
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._backoff = backoff
+        self._latency_tolerance = latency_tolerance
+        self._window = window
+        self._clock = clock
+
+        self._in_flight = 0
+        self._baseline_latency: float | None = None
+        self._last_decrease = float("-inf")
+        self._completions: deque[float] = deque()
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed to run concurrently."""
+        return int(self._limit)
+
+    @property
+    def max_limit(self) -> int:
+        """Upper bound for the limit."""
+        return self._max_limit
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently running."""
+        return self._in_flight
+
+    @property
+    def throughput(self) -> float:
+        """Completed requests per second over the measurement window."""
+        with self._condition:
+            self._expire_completions(self._clock())
+            return len(self._completions) / self._window
+
+    def acquire(self) -> float:
+        """Wait for a free slot.
+
+        Returns:
+            Start time of the request, to pass to release()
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+            return self._clock()
+
+    def release(self, started: float, *, overloaded: bool = False) -> None:
+        """Free a slot and adjust the limit.
+
+        Args:
+            started: Value returned by the matching acquire()
+            overloaded: Whether the request was throttled or failed server-side
+        """
+        with self._condition:
+            now = self._clock()
+            latency = now - started
+            self._in_flight -= 1
+
+            if overloaded:
+                self._decrease(started, now)
+            else:
+                self._completions.append(now)
+                self._expire_completions(now)
+                if self._baseline_latency is None or latency < self._baseline_latency:
+                    self._baseline_latency = latency
+                else:
+                    # Drift slowly upwards so a lasting slowdown becomes the new normal
+                    self._baseline_latency += (latency - self._baseline_latency) * 0.05
+
+                if latency > self._baseline_latency * self._latency_tolerance:
+                    self._decrease(started, now)
+                else:
+                    self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self) -> Generator[None]:
+        """Run the enclosed request within the limit.
+
+        JikenAPIError (including rate limiting) marks the request as
+        overloaded; other errors such as authentication failures do not
+        affect the limit.
+        """
+        started = self.acquire()
+        overloaded = False
+        try:
+            yield
+        except JikenAPIError:
+            overloaded = True
+            raise
+        finally:
+            self.release(started, overloaded=overloaded)
+
+    def _decrease(self, started: float, now: float) -> None:
+        if started < self._last_decrease:
+            return
+        self._limit = max(self._min_limit, self._limit * self._backoff)
+        self._last_decrease = now
+
+    def _expire_completions(self, now: float) -> None:
+        while self._completions and self._completions[0] <= now - self._window:
+            self._completions.popleft()
@@ -0,0 +1,150 @@
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from jiken.categories import parse_period
+from jiken.models import Transaction
+
+_FORMAT_CACHE_SIZE = 1 << 16
+
+
+@lru_cache(maxsize=_FORMAT_CACHE_SIZE)
+def _format_jpy(amount_jpy: int) -> str:
+    return f"¥{amount_jpy:,}"
+
+
+@lru_cache(maxsize=_FORMAT_CACHE_SIZE)
+def _format_usd(amount_usd: int) -> str:
+    return f"${amount_usd:,}"
+
+
+Quarter = tuple[int, int]
+"""Transaction period as (year, quarter)"""
+
+
+@dataclass(frozen=True)
+class ExchangeRateTable:
+    """Historical JPY/USD exchange rates keyed by transaction period.
+
+    Periods are matched by year and quarter, so a rate keyed "2024Q1" or
+    (2024, 1) applies to "1st quarter 2024" and "2024年第1四半期" alike.
+
+    Args:
+        rates: JPY per 1 USD for each transaction period, keyed by a period in
+            any response language or a (year, quarter) tuple
+            (e.g., {"2024Q1": 148.6} or {(2024, 1): 148.6})
+        default: Rate used for periods missing from rates (None to disallow)
+    """
+
+    rates: Mapping[str | Quarter, float] = field(default_factory=dict)
+    default: float | None = None
+    _by_quarter: dict[Quarter, float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if any(rate <= 0 for rate in self.rates.values()):
+            raise ValueError("Exchange rates must be positive")
+
+        if self.default is not None and self.default <= 0:
+            raise ValueError("Exchange rates must be positive")
+
+        by_quarter = {}
+        for period, rate in self.rates.items():
+            quarter = period if isinstance(period, tuple) else parse_period(period)
+            if quarter is None:
+                raise ValueError(f"Unrecognized period: '{period}'")
+            by_quarter[quarter] = rate
+        object.__setattr__(self, "_by_quarter", by_quarter)
+
+    def rate_for(self, period: str) -> float:
+        """Look up the exchange rate for a transaction period.
+
+        Args:
+            period: Transaction period (e.g., "1st quarter 2024")
+
+        Returns:
+            JPY per 1 USD for the period
+
+        Raises:
+            ValueError: No rate for the period and no default rate
+        """
+        quarter = parse_period(period)
+        rate = self._by_quarter.get(quarter, self.default) if quarter else self.default
+        if rate is None:
+            raise ValueError(f"No exchange rate for period '{period}'")
+        return rate
+
+
+# Same rate as TradePrice.format uses when no table is given
+_DEFAULT_RATES = ExchangeRateTable(default=150.0)
+
+
+def convert_to_usd(
+    amounts_jpy: Iterable[int], periods: Iterable[str], rates: ExchangeRateTable
+) -> list[int]:
+    """Convert a column of JPY amounts to USD using per-period rates.
+
+    Rates are resolved once per distinct period, then applied in a single pass.
+
+    Args:
+        amounts_jpy: Prices in Japanese Yen
+        periods: Transaction period of each price
+        rates: Exchange rate table
+
+    Returns:
+        Prices in US Dollars, rounded as TradePrice.as_usd does
+    """
+    periods = list(periods)
+    rate_of = {period: rates.rate_for(period) for period in set(periods)}
+    return [
+        round(amount / rate_of[period]) for amount, period in zip(amounts_jpy, periods, strict=True)
+    ]
+
+
+def format_prices(
+    amounts_jpy: Iterable[int],
+    periods: Iterable[str],
+    language: str,
+    rates: ExchangeRateTable | None = None,
+) -> list[str]:
+    """Format a column of prices based on language setting.
+
+    Formatted strings are cached, so repeated values are formatted only once.
+
+    Args:
+        amounts_jpy: Prices in Japanese Yen
+        periods: Transaction period of each price (used for "en" only)
+        language: Language code ("ja" returns JPY, "en" returns USD)
+        rates: Exchange rate table (default: 150.0 for every period)
+
+    Returns:
+        Formatted price strings, matching TradePrice.format
+    """
+    if language == "ja":
+        return [_format_jpy(amount) for amount in amounts_jpy]
+
+    amounts_usd = convert_to_usd(amounts_jpy, periods, rates or _DEFAULT_RATES)
+    return [_format_usd(amount) for amount in amounts_usd]
+
+
+def format_transaction_prices(
+    transactions: Iterable[Transaction],
+    language: str,
+    rates: ExchangeRateTable | None = None,
+) -> list[str]:
+    """Format the prices of a result set, converting with each transaction's period rate.
+
+    Args:
+        transactions: Transactions to format
+        language: Language code ("ja" returns JPY, "en" returns USD)
+        rates: Exchange rate table (default: 150.0 for every period)
+
+    Returns:
+        Formatted price strings in the order of transactions
+    """
+    transactions = list(transactions)
+    return format_prices(
+        [transaction.transaction_price.amount_jpy for transaction in transactions],
+        [transaction.transaction_period for transaction in transactions],
+        language,
+        rates,
+    )
@@ -12,3 +12,20 @@ class JikenRequestError(JikenError):
 
 class JikenAPIError(JikenError):
     """General API error (5xx)."""
+
+
+class JikenRateLimitError(JikenAPIError):
+    """Too many requests (429 Too Many Requests).
+
+    Args:
+        message: Error message
+        retry_after: Seconds the API asked to wait before retrying (None if not sent)
+    """
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class JikenTimeoutError(JikenAPIError):
+    """Request timed out or exceeded its deadline."""
@@ -0,0 +1,168 @@
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class HedgePolicy:
+    """Hedged requests: issue a duplicate when the first one is unusually slow.
+
+    The hedge delay is the ``quantile`` of recently observed latencies, so
+    only the slowest requests (about 5% by default) are duplicated. Latency is
+    measured for every first attempt from when a thread starts running it,
+    including failed and timed-out ones. The first successful response wins;
+    the other request is cancelled if it has not started yet, otherwise its
+    result is discarded once it completes (bounded by the client's timeout).
+
+    Each hedged call occupies up to two of ``max_workers`` threads, so size
+    it to the number of concurrent callers. Bulk searches are not hedged;
+    their concurrency is governed by the AdaptiveLimiter instead.
+
+    Args:
+        quantile: Latency quantile used as the hedge delay (0-1)
+        min_delay: Lower bound for the hedge delay (seconds)
+        initial_delay: Hedge delay until min_samples latencies were observed
+            (None disables hedging until then)
+        window: Number of recent latencies considered
+        min_samples: Latencies required before the quantile is used
+        max_workers: Maximum number of threads running requests (about
+            twice the number of concurrent callers)
+    """
+
+    def __init__(
+        self,
+        quantile: float = 0.95,
+        *,
+        min_delay: float = 0.01,
+        initial_delay: float | None = None,
+        window: int = 200,
+        min_samples: int = 20,
+        max_workers: int = 16,
+    ) -> None:
+        if not 0 < quantile < 1:
+            raise ValueError("Quantile must be between 0 and 1")
+
+        if min_samples < 1 or window < min_samples:
+            raise ValueError("Window must be at least min_samples, which must be positive")
+
+        self._quantile = quantile
+        self._min_delay = min_delay
+        self._initial_delay = initial_delay
+        self._min_samples = min_samples
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="jiken-hedge")
+
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    @property
+    def hedge_rate(self) -> float:
+        """Fraction of requests for which a hedge was issued."""
+        return self.hedges / self.requests if self.requests else 0.0
+
+    def delay(self) -> float | None:
+        """Current hedge delay in seconds (None if hedging is not active yet)."""
+        with self._lock:
+            if len(self._latencies) < self._min_samples:
+                return self._initial_delay
+            latencies = sorted(self._latencies)
+
+        index = min(len(latencies) - 1, int(self._quantile * len(latencies)))
+        return max(self._min_delay, latencies[index])
+
+    def run(self, call: Callable[[], T], timeout: float | None = None) -> T:
+        """Run a call, hedging it with a duplicate if it is slow.
+
+        Args:
+            call: Request to run; must be safe to run twice concurrently
+            timeout: Overall time limit in seconds (None for no limit)
+
+        Returns:
+            Result of the first successful call
+
+        Raises:
+            TimeoutError: No call completed within timeout
+            Exception: Error of the last failed call if all calls failed
+        """
+        started = time.monotonic()
+        deadline = started + timeout if timeout is not None else None
+        hedge_at = None
+        delay = self.delay()
+        if delay is not None:
+            hedge_at = started + delay
+
+        with self._lock:
+            self.requests += 1
+
+        attempt = _Attempt(call)
+        primary = self._executor.submit(attempt)
+        primary.add_done_callback(lambda _: self._observe(attempt))
+        pending = {primary}
+        error: BaseException | None = None
+
+        while pending:
+            wake_times = [t for t in (hedge_at, deadline) if t is not None]
+            wait_timeout = max(0.0, min(wake_times) - time.monotonic()) if wake_times else None
+            done, pending = wait(pending, timeout=wait_timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    for loser in pending:
+                        loser.cancel()
+                    if future is not primary:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result()
+
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                break
+
+            if hedge_at is not None and now >= hedge_at:
+                hedge_at = None
+                if pending:
+                    with self._lock:
+                        self.hedges += 1
+                    pending.add(self._executor.submit(call))
+
+        for future in pending:
+            future.cancel()
+        # A primary still running at the deadline took at least this long
+        self._observe(attempt)
+
+        if pending or error is None:
+            raise TimeoutError("Request timed out")
+        raise error
+
+    def close(self) -> None:
+        """Shut down the request threads."""
+        self._executor.shutdown(cancel_futures=True)
+
+    def _observe(self, attempt: "_Attempt[Any]") -> None:
+        # Record the latency of a primary attempt once, whether it succeeded,
+        # failed or was still running when the caller gave up
+        with self._lock:
+            if attempt.started is None or attempt.observed:
+                return
+            attempt.observed = True
+            self._latencies.append(time.monotonic() - attempt.started)
+
+
+class _Attempt(Generic[T]):
+    """Primary call that remembers when a worker started running it."""
+
+    def __init__(self, call: Callable[[], T]) -> None:
+        self._call = call
+        self.started: float | None = None
+        self.observed = False
+
+    def __call__(self) -> T:
+        self.started = time.monotonic()
+        return self._call()
@@ -83,6 +83,8 @@ class Transaction:
 
     Core fields for identifying undervalued properties.
     Field names are in English, but values are in the language specified by SearchCondition.
+    The code and period fields are language-independent, so results fetched in
+    different languages can be grouped and merged on them (see jiken.categories).
     """
 
     # Price information (core for valuation)
@@ -128,3 +130,26 @@ class Transaction:
     # Metadata
     transaction_period: str
     """Transaction period (e.g., "2024Q1")"""
+
+    # Canonical values (language-independent)
+    prefecture_code: int | None = None
+    """Prefecture code (1-47, as in SearchCondition.area)"""
+
+    property_type_code: int | None = None
+    """Property type code (see jiken.categories.PROPERTY_TYPES)"""
+
+    structure_code: int | None = None
+    """Building structure code (see jiken.categories.STRUCTURES)"""
+
+    period_year: int | None = None
+    """Year of the transaction period"""
+
+    period_quarter: int | None = None
+    """Quarter of the transaction period (1-4)"""
+
+    @property
+    def price_per_sqm(self) -> float | None:
+        """Transaction price per square meter in JPY (None if price or area is unknown)."""
+        if self.transaction_price.amount_jpy <= 0 or self.area <= 0:
+            return None
+        return self.transaction_price.amount_jpy / self.area
@@ -0,0 +1,299 @@
+import gzip
+import json
+import operator
+import sys
+from collections.abc import Callable, Container, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from jiken.categories import PREFECTURES, PROPERTY_TYPES, STRUCTURES, parse_period
+from jiken.exceptions import JikenAPIError
+from jiken.models import TradePrice, Transaction
+
+Columns = tuple[list[Any], ...]
+
+
+def to_int(value: Any) -> int | None:
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def to_float(value: Any) -> float | None:
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def intern(value: Any) -> Any:
+    # Share repeated categorical strings instead of storing one copy per item
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def period_year(period: str | None) -> int | None:
+    parsed = parse_period(period)
+    return parsed[0] if parsed is not None else None
+
+
+def period_quarter(period: str | None) -> int | None:
+    parsed = parse_period(period)
+    return parsed[1] if parsed is not None else None
+
+
+# Extract each Transaction field (in declaration order) from a raw API item
+FIELDS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "transaction_price": lambda item: to_int(item.get("TradePrice")) or 0,
+    "area": lambda item: to_float(item.get("Area")) or 0.0,
+    "unit_price": lambda item: to_float(item.get("UnitPrice")),
+    "prefecture": lambda item: PREFECTURES.intern(item.get("Prefecture", "")),
+    "city": lambda item: intern(item.get("Municipality", "")),
+    "district": lambda item: intern(item.get("DistrictName")),
+    "building_year": lambda item: to_int(item.get("BuildingYear")),
+    "property_type": lambda item: PROPERTY_TYPES.intern(item.get("Type", "")),
+    "structure": lambda item: STRUCTURES.intern(item.get("Structure")),
+    "floor_area_ratio": lambda item: to_float(item.get("FloorAreaRatio")),
+    "building_coverage": lambda item: to_float(item.get("CoverageRatio")),
+    "frontage_road_width": lambda item: to_float(item.get("Frontage")),
+    "transaction_period": lambda item: intern(item.get("Period", "")),
+    "prefecture_code": lambda item: PREFECTURES.code(item.get("Prefecture")),
+    "property_type_code": lambda item: PROPERTY_TYPES.code(item.get("Type")),
+    "structure_code": lambda item: STRUCTURES.code(item.get("Structure")),
+    "period_year": lambda item: period_year(item.get("Period")),
+    "period_quarter": lambda item: period_quarter(item.get("Period")),
+}
+
+# Fields holding text; every other field is numeric
+_TEXT_FIELDS = frozenset(
+    ("prefecture", "city", "district", "property_type", "structure", "transaction_period")
+)
+
+# Predicates see a missing price or area as None instead of the 0 stored on
+# Transaction, so ordering comparisons do not match items without one
+_PREDICATE_FIELDS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    **FIELDS,
+    "transaction_price": lambda item: to_int(item.get("TradePrice")),
+    "area": lambda item: to_float(item.get("Area")),
+}
+
+_ORDERING_OPERATORS = frozenset(("<", "<=", ">", ">="))
+
+_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda value, options: value in options,
+}
+
+
+@dataclass(frozen=True)
+class Predicate:
+    """Condition on a Transaction field, evaluated on the raw API item.
+
+    Only the referenced field is converted, so items that do not match are
+    discarded before a Transaction is built. Ordering comparisons against a
+    missing (None) value never match; this includes a missing
+    transaction_price or area, which Transaction stores as 0.
+    transaction_price compares as int JPY.
+
+    Args:
+        field: Transaction field name (e.g., "property_type")
+        op: One of "==", "!=", "<", "<=", ">", ">=", "in"
+        value: Value to compare with (a collection for "in")
+    """
+
+    field: str
+    op: str
+    value: Any
+
+    def __post_init__(self) -> None:
+        if self.field not in FIELDS:
+            raise ValueError(f"Unknown field: '{self.field}'")
+
+        if self.op not in _OPERATORS:
+            raise ValueError(f"Unknown operator: '{self.op}'")
+
+        # Reject values that would raise TypeError while items are parsed
+        if self.op == "in":
+            if isinstance(self.value, (str, bytes)) or not isinstance(self.value, Container):
+                raise TypeError(f"Value of 'in' must be a collection, not {self.value!r}")
+        elif self.op in _ORDERING_OPERATORS:
+            expected: type | tuple[type, ...] = str if self.field in _TEXT_FIELDS else (int, float)
+            if isinstance(self.value, bool) or not isinstance(self.value, expected):
+                raise TypeError(
+                    f"Cannot compare '{self.field}' with {type(self.value).__name__} "
+                    f"using '{self.op}'"
+                )
+
+    def matches(self, item: dict[str, Any]) -> bool:
+        """Evaluate the predicate on a raw API item."""
+        value = _PREDICATE_FIELDS[self.field](item)
+        if value is None and self.op in _ORDERING_OPERATORS:
+            return False
+        return _OPERATORS[self.op](value, self.value)
+
+
+def check_fields(fields: Iterable[str]) -> tuple[str, ...]:
+    """Validate a field projection.
+
+    Args:
+        fields: Transaction field names
+
+    Returns:
+        Field names as a tuple
+
+    Raises:
+        ValueError: A field name is unknown
+    """
+    fields = tuple(fields)
+    for name in fields:
+        if name not in FIELDS:
+            raise ValueError(f"Unknown field: '{name}'")
+    return fields
+
+
+def filter_items(
+    items: Iterable[dict[str, Any]], where: Sequence[Predicate]
+) -> Iterator[dict[str, Any]]:
+    """Yield raw API items matching every predicate."""
+    if not where:
+        yield from items
+        return
+
+    for item in items:
+        if all(predicate.matches(item) for predicate in where):
+            yield item
+
+
+def decode_response(body: bytes, content_encoding: str | None) -> dict[str, Any]:
+    """Decode a raw (optionally gzip-compressed) JSON response body.
+
+    Args:
+        body: Raw response body
+        content_encoding: Value of the Content-Encoding header
+
+    Returns:
+        Parsed JSON response data
+
+    Raises:
+        JikenAPIError: Response could not be decoded
+    """
+    try:
+        if content_encoding == "gzip":
+            body = gzip.decompress(body)
+        return json.loads(body.decode("utf-8"))
+    except (OSError, EOFError, json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise JikenAPIError("Failed to parse API response") from e
+
+
+def parse_transaction_item(item: dict[str, Any]) -> Transaction:
+    """Parse a single transaction item from API response.
+
+    Args:
+        item: Transaction item from API response
+
+    Returns:
+        Transaction object
+    """
+    price, *rest = (extract(item) for extract in FIELDS.values())
+    return Transaction(TradePrice(amount_jpy=price), *rest)
+
+
+def parse_transactions(data: dict[str, Any], where: Sequence[Predicate] = ()) -> list[Transaction]:
+    """Parse API response data to Transaction objects.
+
+    Args:
+        data: API response data
+        where: Predicates items must match to be parsed
+
+    Returns:
+        List of Transaction objects
+    """
+    return [parse_transaction_item(item) for item in filter_items(data.get("data", ()), where)]
+
+
+def parse_records(
+    data: dict[str, Any], fields: Sequence[str], where: Sequence[Predicate] = ()
+) -> list[dict[str, Any]]:
+    """Parse only the requested fields of matching items.
+
+    Args:
+        data: API response data
+        fields: Transaction field names to convert
+        where: Predicates items must match to be parsed
+
+    Returns:
+        One dict per item keyed by field name (transaction_price as int JPY)
+    """
+    extractors = [(name, FIELDS[name]) for name in check_fields(fields)]
+    return [
+        {name: extract(item) for name, extract in extractors}
+        for item in filter_items(data.get("data", ()), where)
+    ]
+
+
+def parse_columns(
+    body: bytes,
+    content_encoding: str | None,
+    where: Sequence[Predicate] = (),
+    fields: Sequence[str] | None = None,
+) -> Columns:
+    """Decode a raw response body and parse it into column lists.
+
+    Intended to run in a worker process: the result holds only builtin
+    scalars, one list per field, so it is cheap to pickle back to the parent.
+
+    Args:
+        body: Raw response body
+        content_encoding: Value of the Content-Encoding header
+        where: Predicates items must match to be parsed
+        fields: Field names to convert, in column order (default: every
+            Transaction field in declaration order)
+
+    Returns:
+        Tuple of column lists (transaction price as int JPY)
+    """
+    names = check_fields(fields) if fields is not None else tuple(FIELDS)
+    extractors = tuple(FIELDS[name] for name in names)
+    columns: Columns = tuple([] for _ in extractors)
+    items = decode_response(body, content_encoding).get("data", ())
+    for item in filter_items(items, where):
+        for column, extract in zip(columns, extractors, strict=True):
+            column.append(extract(item))
+    return columns
+
+
+def transactions_from_columns(columns: Columns) -> list[Transaction]:
+    """Rebuild Transaction objects from column lists produced by parse_columns.
+
+    Args:
+        columns: Tuple of column lists
+
+    Returns:
+        List of Transaction objects
+    """
+    return [
+        Transaction(TradePrice(amount_jpy=price), *rest)
+        for price, *rest in zip(*columns, strict=True)
+    ]
+
+
+def records_from_columns(columns: Columns, fields: Sequence[str]) -> list[dict[str, Any]]:
+    """Build projected records from column lists produced by parse_columns.
+
+    Args:
+        columns: Tuple of column lists
+        fields: Field names the columns were parsed with
+
+    Returns:
+        One dict per row keyed by field name
+    """
+    return [dict(zip(fields, row, strict=True)) for row in zip(*columns, strict=True)]
@@ -0,0 +1,163 @@
+import multiprocessing
+import queue
+import threading
+import time
+from collections.abc import Callable, Generator, Iterable, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+from jiken.concurrency import AdaptiveLimiter
+from jiken.exceptions import JikenRateLimitError
+from jiken.models import SearchCondition
+from jiken.parser import Columns, Predicate, check_fields, parse_columns
+
+_RATE_LIMIT_RETRIES = 3
+_RATE_LIMIT_BACKOFF = 0.5
+
+
+class ParsePipeline:
+    """Fetch responses on threads and parse them on a process pool.
+
+    Fetcher threads hand raw (still gzip-compressed) response bodies to the
+    parse executor, so decompression and JSON decoding never hold the GIL of
+    the fetching process. A semaphore bounds the number of responses that
+    have been fetched but not yet consumed: when the consumer falls behind,
+    fetchers block instead of buffering results in memory.
+
+    With an AdaptiveLimiter, the number of concurrent fetches adapts to the
+    API's latency and throttling instead of staying at fetch_workers, and
+    rate-limited (429) fetches are retried after the limiter backs off,
+    waiting for the Retry-After header or an exponential backoff.
+
+    Worker processes are started with the "spawn" method, so scripts using
+    the pipeline need an ``if __name__ == "__main__":`` guard.
+
+    Args:
+        fetch_raw: Callable returning (body, Content-Encoding) for query params
+        fetch_workers: Number of fetcher threads (default: 4, or the limiter's
+            max_limit)
+        parse_workers: Number of parser processes (default: CPU count)
+        max_pending: Maximum number of fetched responses not yet consumed
+            (default: twice fetch_workers)
+        parse_executor: Executor used for parsing instead of a dedicated
+            process pool; it is not shut down by the pipeline
+        limiter: Adaptive limiter gating concurrent fetches
+        sleep: Function used to wait before retrying (default: time.sleep)
+    """
+
+    def __init__(
+        self,
+        fetch_raw: Callable[[dict[str, str]], tuple[bytes, str | None]],
+        *,
+        fetch_workers: int | None = None,
+        parse_workers: int | None = None,
+        max_pending: int | None = None,
+        parse_executor: Executor | None = None,
+        limiter: AdaptiveLimiter | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if fetch_workers is None:
+            fetch_workers = limiter.max_limit if limiter is not None else 4
+
+        if fetch_workers < 1:
+            raise ValueError("fetch_workers must be at least 1")
+
+        if max_pending is not None and max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+
+        self._fetch_raw = fetch_raw
+        self._fetch_workers = fetch_workers
+        self._parse_workers = parse_workers
+        self._max_pending = max_pending or 2 * fetch_workers
+        self._parse_executor = parse_executor
+        self._limiter = limiter
+        self._sleep = sleep
+
+    def run(
+        self,
+        conditions: Iterable[SearchCondition],
+        build_params: Callable[[SearchCondition], dict[str, str]],
+        where: Sequence[Predicate] = (),
+        fields: Sequence[str] | None = None,
+    ) -> Generator[tuple[SearchCondition, Columns]]:
+        """Fetch and parse every condition, yielding results as they complete.
+
+        Args:
+            conditions: Search conditions to fetch
+            build_params: Callable converting a condition to query parameters
+            where: Predicates evaluated in the parser before conversion
+            fields: Field names to parse (default: every Transaction field)
+
+        Returns:
+            Generator of (condition, columns) pairs in completion order
+
+        Raises:
+            JikenError: A fetch or parse failed; remaining work is cancelled
+        """
+        conditions = list(conditions)
+        where = tuple(where)
+        if fields is not None:
+            fields = check_fields(fields)
+        if not conditions:
+            return
+
+        slots = threading.Semaphore(self._max_pending)
+        stop = threading.Event()
+        done: queue.SimpleQueue[tuple[SearchCondition, Future[Columns]]] = queue.SimpleQueue()
+
+        parse_pool = self._parse_executor or ProcessPoolExecutor(
+            self._parse_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        fetch_pool = ThreadPoolExecutor(self._fetch_workers, thread_name_prefix="jiken-fetch")
+
+        def fetch(condition: SearchCondition) -> None:
+            slots.acquire()
+            if stop.is_set():
+                return
+
+            future: Future[Columns]
+            try:
+                body, content_encoding = self._fetch(build_params(condition))
+                future = parse_pool.submit(parse_columns, body, content_encoding, where, fields)
+            except Exception as e:
+                future = Future()
+                future.set_exception(e)
+
+            future.add_done_callback(lambda f: done.put((condition, f)))
+
+        for condition in conditions:
+            fetch_pool.submit(fetch, condition)
+
+        try:
+            for _ in conditions:
+                condition, future = done.get()
+                try:
+                    columns = future.result()
+                finally:
+                    slots.release()
+                yield condition, columns
+        finally:
+            stop.set()
+            # Wake fetchers still waiting for a slot so they can exit
+            for _ in range(self._fetch_workers):
+                slots.release()
+            fetch_pool.shutdown(cancel_futures=True)
+            if self._parse_executor is None:
+                parse_pool.shutdown(cancel_futures=True)
+
+    def _fetch(self, params: dict[str, str]) -> tuple[bytes, str | None]:
+        if self._limiter is None:
+            return self._fetch_raw(params)
+
+        retries = 0
+        while True:
+            try:
+                with self._limiter.slot():
+                    return self._fetch_raw(params)
+            except JikenRateLimitError as e:
+                retries += 1
+                if retries > _RATE_LIMIT_RETRIES:
+                    raise
+                delay = e.retry_after
+                if delay is None:
+                    delay = _RATE_LIMIT_BACKOFF * 2 ** (retries - 1)
+                self._sleep(delay)
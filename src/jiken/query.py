@@ -0,0 +1,144 @@
+import heapq
+import itertools
+from collections.abc import Callable, Hashable, Iterable
+
+from jiken.models import SearchCondition, Transaction
+from jiken.sketch import QuantileSketch
+
+
+def _price_per_sqm(transaction: Transaction) -> float | None:
+    return transaction.price_per_sqm
+
+
+class TopKQuery:
+    """Streaming top-K query with bounded memory per group.
+
+    Transactions are consumed as sub-query results arrive and only the best
+    ``k`` per group are retained in a heap, so memory is O(k) per group no
+    matter how many transactions are scanned. A quantile sketch per group
+    additionally tracks the distribution of every scanned value, which makes
+    percentile thresholds available without keeping the transactions.
+
+    Args:
+        k: Number of transactions to keep per group
+        key: Value to rank by; transactions where it is None are skipped
+            (default: price per square meter)
+        group_by: Group key of a transaction (default: a single group, None)
+        largest: Keep the largest values instead of the smallest
+        where: Predicate selecting transactions to consider
+    """
+
+    def __init__(
+        self,
+        k: int,
+        *,
+        key: Callable[[Transaction], float | None] = _price_per_sqm,
+        group_by: Callable[[Transaction], Hashable] | None = None,
+        largest: bool = False,
+        where: Callable[[Transaction], bool] | None = None,
+    ) -> None:
+        if k < 1:
+            raise ValueError("k must be at least 1")
+
+        self._k = k
+        self._key = key
+        self._group_by = group_by
+        self._largest = largest
+        self._where = where
+        # Heap entries are (priority, sequence, value, transaction); the worst
+        # retained transaction has the lowest priority and sits at the top.
+        # Sequence numbers are unique, so transactions are never compared.
+        self._heaps: dict[Hashable, list[tuple[float, int, float, Transaction]]] = {}
+        self._sketches: dict[Hashable, QuantileSketch] = {}
+        self._sequence = itertools.count()
+        self.scanned = 0
+
+    def add(self, transaction: Transaction) -> None:
+        """Consider a single transaction."""
+        self.scanned += 1
+        if self._where is not None and not self._where(transaction):
+            return
+
+        value = self._key(transaction)
+        if value is None:
+            return
+
+        group = self._group_by(transaction) if self._group_by is not None else None
+        sketch = self._sketches.get(group)
+        if sketch is None:
+            sketch = self._sketches[group] = QuantileSketch()
+        sketch.add(value)
+
+        entry = (value if self._largest else -value, next(self._sequence), value, transaction)
+        heap = self._heaps.setdefault(group, [])
+        if len(heap) < self._k:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+
+    def update(self, transactions: Iterable[Transaction]) -> None:
+        """Consider every transaction of an iterable."""
+        for transaction in transactions:
+            self.add(transaction)
+
+    def consume(self, results: Iterable[tuple[SearchCondition, list[Transaction]]]) -> "TopKQuery":
+        """Consume sub-query results as they arrive.
+
+        Args:
+            results: (condition, transactions) pairs, e.g. from
+                JikenClient.search_transactions_bulk
+
+        Returns:
+            This query, for chaining
+        """
+        for _, transactions in results:
+            self.update(transactions)
+        return self
+
+    def top(self, group: Hashable = None) -> list[Transaction]:
+        """Retained transactions of a group, best first.
+
+        Args:
+            group: Group key (None when the query is not grouped)
+
+        Returns:
+            Up to k transactions ordered by key
+        """
+        heap = self._heaps.get(group, [])
+        return [entry[3] for entry in sorted(heap, reverse=True)]
+
+    def results(self) -> dict[Hashable, list[Transaction]]:
+        """Retained transactions of every group, best first."""
+        return {group: self.top(group) for group in self._heaps}
+
+    def threshold(self, q: float, group: Hashable = None) -> float | None:
+        """Estimate the q-quantile of all scanned values of a group.
+
+        Args:
+            q: Quantile between 0 and 1
+            group: Group key (None when the query is not grouped)
+
+        Returns:
+            Estimated value (within 1%), or None if the group is empty
+        """
+        sketch = self._sketches.get(group)
+        return sketch.quantile(q) if sketch is not None else None
+
+    def below_percentile(self, q: float) -> dict[Hashable, list[Transaction]]:
+        """Retained transactions whose value is at or below their group's q-quantile.
+
+        Args:
+            q: Quantile between 0 and 1 (e.g., 0.05 for the cheapest 5%)
+
+        Returns:
+            Retained transactions per group, best first
+        """
+        selected: dict[Hashable, list[Transaction]] = {}
+        for group, heap in self._heaps.items():
+            threshold = self._sketches[group].quantile(q)
+            selected[group] = [
+                entry[3]
+                for entry in sorted(heap, reverse=True)
+                if threshold is not None and entry[2] <= threshold
+            ]
+        return selected
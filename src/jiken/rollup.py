@@ -0,0 +1,169 @@
+import json
+import os
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from jiken.models import Transaction
+from jiken.sketch import QuantileSketch
+
+RollupKey = tuple[str, str, str, str]
+"""Group key: (prefecture, city, property_type, transaction_period)"""
+
+# Version 1 keyed groups by city alone, merging same-named cities of
+# different prefectures; such files must be rebuilt
+_FORMAT_VERSION = 2
+
+
+@dataclass
+class RollupGroup:
+    """Materialized price/m² aggregate for one rollup group."""
+
+    count: int
+    """Number of transactions with a known price per square meter"""
+
+    median_price_per_sqm: float | None
+    """Median price per square meter (JPY), precomputed for constant-time reads"""
+
+    sketch: QuantileSketch
+    """Mergeable quantile sketch of price per square meter"""
+
+    @classmethod
+    def from_sketch(cls, sketch: QuantileSketch) -> "RollupGroup":
+        return cls(count=sketch.count, median_price_per_sqm=sketch.quantile(0.5), sketch=sketch)
+
+
+class PriceIndexRollup:
+    """Quarterly price/m² rollups per city and property type, persisted to a file.
+
+    Aggregates are kept per (prefecture, city, property_type,
+    transaction_period) group, since city names repeat across prefectures
+    and updated incrementally: ingesting newly fetched transactions only
+    recomputes the groups they touch, and medians are stored precomputed so
+    dashboard reads are dictionary lookups.
+
+    Args:
+        path: JSON file the rollup is loaded from (if it exists) and saved to
+        relative_accuracy: Relative accuracy of the quantile sketches
+    """
+
+    def __init__(self, path: str | Path, relative_accuracy: float = 0.01) -> None:
+        self._path = Path(path)
+        self._relative_accuracy = relative_accuracy
+        self._groups: dict[RollupKey, RollupGroup] = {}
+
+        if self._path.exists():
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def __iter__(self) -> Iterator[RollupKey]:
+        return iter(self._groups)
+
+    def update(
+        self, transactions: Iterable[Transaction], *, replace: bool = True
+    ) -> set[RollupKey]:
+        """Fold transactions into the rollup.
+
+        Args:
+            transactions: Newly fetched transactions
+            replace: Replace touched groups with the new data (default), so
+                refetching a quarter is idempotent; False merges the data into
+                the existing groups, e.g. for disjoint batches of one quarter
+
+        Returns:
+            Keys of the groups that were recomputed
+        """
+        sketches: dict[RollupKey, QuantileSketch] = {}
+        for transaction in transactions:
+            price_per_sqm = transaction.price_per_sqm
+            if price_per_sqm is None:
+                continue
+
+            key = (
+                transaction.prefecture,
+                transaction.city,
+                transaction.property_type,
+                transaction.transaction_period,
+            )
+            sketch = sketches.get(key)
+            if sketch is None:
+                sketch = sketches[key] = QuantileSketch(self._relative_accuracy)
+            sketch.add(price_per_sqm)
+
+        for key, sketch in sketches.items():
+            existing = self._groups.get(key)
+            if not replace and existing is not None:
+                sketch.merge(existing.sketch)
+            self._groups[key] = RollupGroup.from_sketch(sketch)
+
+        return set(sketches)
+
+    def get(
+        self, prefecture: str, city: str, property_type: str, period: str
+    ) -> RollupGroup | None:
+        """Look up the aggregate of a group.
+
+        Args:
+            prefecture: Prefecture name
+            city: City/ward name
+            property_type: Property type
+            period: Transaction period (e.g., "2024Q1")
+
+        Returns:
+            Group aggregate, or None if no data was ingested for the group
+        """
+        return self._groups.get((prefecture, city, property_type, period))
+
+    def median_price_per_sqm(
+        self, prefecture: str, city: str, property_type: str, period: str
+    ) -> float | None:
+        """Look up the median price per square meter of a group.
+
+        Returns:
+            Median price per square meter (JPY), or None if the group is unknown
+        """
+        group = self.get(prefecture, city, property_type, period)
+        return group.median_price_per_sqm if group is not None else None
+
+    def save(self) -> None:
+        """Write the rollup to its file atomically."""
+        data = {
+            "version": _FORMAT_VERSION,
+            "groups": [
+                {
+                    "prefecture": prefecture,
+                    "city": city,
+                    "property_type": property_type,
+                    "transaction_period": period,
+                    "count": group.count,
+                    "median_price_per_sqm": group.median_price_per_sqm,
+                    "sketch": group.sketch.to_dict(),
+                }
+                for (prefecture, city, property_type, period), group in self._groups.items()
+            ],
+        }
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_name(f"{self._path.name}.tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False), "utf-8")
+        os.replace(tmp_path, self._path)
+
+    def _load(self) -> None:
+        data = json.loads(self._path.read_text("utf-8"))
+        if data.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported rollup file version: {data.get('version')}")
+
+        for item in data["groups"]:
+            key = (
+                item["prefecture"],
+                item["city"],
+                item["property_type"],
+                item["transaction_period"],
+            )
+            self._groups[key] = RollupGroup(
+                count=item["count"],
+                median_price_per_sqm=item["median_price_per_sqm"],
+                sketch=QuantileSketch.from_dict(item["sketch"]),
+            )
@@ -0,0 +1,93 @@
+import math
+from typing import Any
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch with bounded relative error (DDSketch-style).
+
+    Positive values are counted in logarithmic buckets, so any quantile is
+    estimated within ``relative_accuracy`` of a true value while memory grows
+    only with the logarithm of the value range. Sketches built with the same
+    accuracy can be merged by adding bucket counts.
+
+    Args:
+        relative_accuracy: Maximum relative error of quantile estimates (0-1)
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("Relative accuracy must be between 0 and 1")
+
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._bins: dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        """Add a value (values <= 0 are counted as zero)."""
+        if value > 0:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self._bins[index] = self._bins.get(index, 0) + 1
+        else:
+            self._zero_count += 1
+        self.count += 1
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add all values of another sketch to this one.
+
+        Raises:
+            ValueError: Sketches have different relative accuracy
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+
+        for index, count in other._bins.items():
+            self._bins[index] = self._bins.get(index, 0) + count
+        self._zero_count += other._zero_count
+        self.count += other.count
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate the q-quantile.
+
+        Args:
+            q: Quantile between 0 and 1 (0.5 for the median)
+
+        Returns:
+            Estimated value, or None if the sketch is empty
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = self._zero_count
+        if rank < seen:
+            return 0.0
+
+        for index in sorted(self._bins):
+            seen += self._bins[index]
+            if rank < seen:
+                return 2 * self._gamma**index / (self._gamma + 1)
+
+        return 2 * self._gamma ** max(self._bins) / (self._gamma + 1)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the sketch to a JSON-compatible dict."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "zero_count": self._zero_count,
+            "bins": [[index, count] for index, count in sorted(self._bins.items())],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "QuantileSketch":
+        """Restore a sketch serialized with to_dict()."""
+        sketch = cls(data["relative_accuracy"])
+        sketch._zero_count = data["zero_count"]
+        sketch._bins = dict(data["bins"])
+        sketch.count = sketch._zero_count + sum(sketch._bins.values())
+        return sketch
@@ -0,0 +1,190 @@
+import hashlib
+import json
+import random
+import socket
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from email.message import Message
+from pathlib import Path
+from typing import Protocol
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+
+@dataclass
+class TransportResponse:
+    """Raw HTTP response returned by a transport.
+
+    Args:
+        body: Response body as received (still gzip-compressed if encoded)
+        headers: Response headers
+    """
+
+    body: bytes
+    headers: Message
+
+
+class Transport(Protocol):
+    """Performs HTTP GET requests for JikenClient.
+
+    Implementations follow urlopen's error contract: HTTP error statuses raise
+    ``urllib.error.HTTPError`` and connection failures raise ``URLError``.
+    """
+
+    def fetch(
+        self, url: str, headers: Mapping[str, str], timeout: float | None = None
+    ) -> TransportResponse:
+        """Fetch a URL.
+
+        Args:
+            url: Request URL including query string
+            headers: Request headers
+            timeout: Seconds to wait for connecting and for each read
+                (None to wait indefinitely); exceeding it raises TimeoutError
+                or URLError wrapping one
+
+        Returns:
+            Raw response
+        """
+        ...
+
+
+class UrllibTransport:
+    """Default transport backed by urllib.request.urlopen."""
+
+    def fetch(
+        self, url: str, headers: Mapping[str, str], timeout: float | None = None
+    ) -> TransportResponse:
+        request = Request(url, headers=dict(headers))
+        if timeout is None:
+            timeout = socket.getdefaulttimeout()
+        with urlopen(request, timeout=timeout) as response:
+            return TransportResponse(body=response.read(), headers=response.headers)
+
+
+def _cassette_key(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def _make_headers(items: list[list[str]]) -> Message:
+    headers = Message()
+    for name, value in items:
+        headers[name] = value
+    return headers
+
+
+class RecordingTransport:
+    """Transport that records every response to a cassette directory.
+
+    Each request URL is stored as ``<sha256(url)>.json`` (status, reason and
+    response headers) plus ``<sha256(url)>.body`` (raw body bytes). Request
+    headers, including the API key, are never written.
+
+    Args:
+        cassette_dir: Directory to write recordings to (created if missing)
+        transport: Transport performing the real requests (default: urllib)
+    """
+
+    def __init__(self, cassette_dir: str | Path, transport: Transport | None = None) -> None:
+        self._cassette_dir = Path(cassette_dir)
+        self._cassette_dir.mkdir(parents=True, exist_ok=True)
+        self._transport = transport or UrllibTransport()
+
+    def fetch(
+        self, url: str, headers: Mapping[str, str], timeout: float | None = None
+    ) -> TransportResponse:
+        try:
+            response = self._transport.fetch(url, headers, timeout)
+        except HTTPError as e:
+            self._record(url, e.code, str(e.reason), e.headers or Message(), b"")
+            raise
+
+        self._record(url, 200, "OK", response.headers, response.body)
+        return response
+
+    def _record(self, url: str, status: int, reason: str, headers: Message, body: bytes) -> None:
+        path = self._cassette_dir / _cassette_key(url)
+        path.with_suffix(".body").write_bytes(body)
+        meta = {
+            "url": url,
+            "status": status,
+            "reason": reason,
+            "headers": [[name, str(value)] for name, value in headers.items()],
+        }
+        path.with_suffix(".json").write_text(json.dumps(meta, ensure_ascii=False), "utf-8")
+
+
+class ReplayTransport:
+    """Transport that serves responses recorded by RecordingTransport.
+
+    Latency and failures can be injected to exercise throughput and tail
+    latency offline. An injected delay longer than the request timeout
+    raises TimeoutError after waiting for the timeout.
+
+    Args:
+        cassette_dir: Directory containing recordings
+        latency: Fixed delay added to every response (seconds)
+        jitter: Mean of an exponentially distributed extra delay (seconds),
+            producing a long latency tail
+        error_rate: Probability (0-1) that a request fails with error_status
+        error_status: HTTP status of injected failures (default: 503)
+        seed: Seed for the random generator, for reproducible runs
+        sleep: Function used to wait (default: time.sleep)
+    """
+
+    def __init__(
+        self,
+        cassette_dir: str | Path,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: int | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if latency < 0 or jitter < 0:
+            raise ValueError("Latency and jitter must not be negative")
+
+        if not 0 <= error_rate <= 1:
+            raise ValueError("Error rate must be between 0 and 1")
+
+        self._cassette_dir = Path(cassette_dir)
+        self._latency = latency
+        self._jitter = jitter
+        self._error_rate = error_rate
+        self._error_status = error_status
+        self._random = random.Random(seed)
+        self._sleep = sleep
+
+    def fetch(
+        self,
+        url: str,
+        headers: Mapping[str, str],  # noqa: ARG002
+        timeout: float | None = None,
+    ) -> TransportResponse:
+        delay = self._latency
+        if self._jitter:
+            delay += self._random.expovariate(1 / self._jitter)
+        if timeout is not None and delay > timeout:
+            self._sleep(timeout)
+            raise TimeoutError("timed out")
+        if delay:
+            self._sleep(delay)
+
+        if self._error_rate and self._random.random() < self._error_rate:
+            raise HTTPError(url, self._error_status, "Injected error", Message(), None)
+
+        path = self._cassette_dir / _cassette_key(url)
+        try:
+            meta = json.loads(path.with_suffix(".json").read_text("utf-8"))
+            body = path.with_suffix(".body").read_bytes()
+        except FileNotFoundError as e:
+            raise URLError(f"No recorded response for {url}") from e
+
+        response_headers = _make_headers(meta["headers"])
+        if meta["status"] >= 400:
+            raise HTTPError(url, meta["status"], meta["reason"], response_headers, None)
+
+        return TransportResponse(body=body, headers=response_headers)
@@ -0,0 +1,27 @@
+from jiken.models import TradePrice, Transaction
+
+
+def make_transaction(
+    amount_jpy: int,
+    area: float = 100.0,
+    *,
+    prefecture: str = "Tokyo",
+    city: str = "Shibuya-ku",
+    property_type: str = "Residential Land",
+    period: str = "2024Q1",
+) -> Transaction:
+    return Transaction(
+        transaction_price=TradePrice(amount_jpy=amount_jpy),
+        area=area,
+        unit_price=None,
+        prefecture=prefecture,
+        city=city,
+        district=None,
+        building_year=None,
+        property_type=property_type,
+        structure=None,
+        floor_area_ratio=None,
+        building_coverage=None,
+        frontage_road_width=None,
+        transaction_period=period,
+    )
@@ -0,0 +1,316 @@
+import threading
+import time
+from collections.abc import Mapping
+from email.message import Message
+from typing import Any
+
+import pytest
+from parameterized import parameterized
+
+from jiken.cache import ResponseCache
+from jiken.client import JikenClient
+from jiken.exceptions import JikenAPIError, JikenTimeoutError
+from jiken.models import SearchCondition
+from jiken.transport import TransportResponse
+
+PARAMS = {"year": "2024", "area": "13", "language": "en"}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingLoader:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, params: dict[str, str]) -> dict[str, Any]:
+        self.release.wait(1.0)
+        self.calls += 1
+        return {"data": [], "version": self.calls}
+
+
+class CountingTransport:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.timeouts: list[float | None] = []
+
+    def fetch(
+        self, url: str, headers: Mapping[str, str], timeout: float | None = None
+    ) -> TransportResponse:
+        self.calls += 1
+        self.timeouts.append(timeout)
+        return TransportResponse(body=b'{"data": []}', headers=Message())
+
+
+class SlowTransport(CountingTransport):
+    def __init__(self, delay: float) -> None:
+        super().__init__()
+        self.delay = delay
+        self.started = threading.Event()
+
+    def fetch(
+        self, url: str, headers: Mapping[str, str], timeout: float | None = None
+    ) -> TransportResponse:
+        self.started.set()
+        time.sleep(self.delay)
+        return super().fetch(url, headers, timeout)
+
+
+class TestResponseCache:
+    def test_fresh_entry_is_served_from_cache(self) -> None:
+        loader = CountingLoader()
+        with ResponseCache(ttl=60, clock=FakeClock()) as cache:
+            cache.get(PARAMS, loader)
+            data = cache.get(dict(reversed(PARAMS.items())), loader)
+
+        assert data["version"] == 1
+        assert loader.calls == 1
+
+    def test_expired_entry_is_refetched_without_stale_ttl(self) -> None:
+        clock = FakeClock()
+        loader = CountingLoader()
+        with ResponseCache(ttl=60, clock=clock) as cache:
+            cache.get(PARAMS, loader)
+            clock.now = 61
+            data = cache.get(PARAMS, loader)
+
+        assert data["version"] == 2
+
+    def test_stale_entry_is_served_while_revalidating(self) -> None:
+        clock = FakeClock()
+        loader = CountingLoader()
+        with ResponseCache(ttl=60, stale_ttl=600, clock=clock) as cache:
+            cache.get(PARAMS, loader)
+            clock.now = 61
+            loader.release.clear()
+
+            stale = cache.get(PARAMS, loader)
+            cache.get(PARAMS, loader)
+            assert stale["version"] == 1
+
+            loader.release.set()
+            for future in list(cache._loading.values()):
+                future.result()
+            assert cache.get(PARAMS, loader)["version"] == 2
+
+        assert loader.calls == 2
+
+    def test_entry_older_than_stale_ttl_is_refetched(self) -> None:
+        clock = FakeClock()
+        loader = CountingLoader()
+        with ResponseCache(ttl=60, stale_ttl=30, clock=clock) as cache:
+            cache.get(PARAMS, loader)
+            clock.now = 100
+
+            assert cache.get(PARAMS, loader)["version"] == 2
+
+    def test_failed_revalidation_keeps_stale_entry(self) -> None:
+        clock = FakeClock()
+        with ResponseCache(ttl=60, stale_ttl=600, clock=clock) as cache:
+            cache.get(PARAMS, lambda params: {"data": ["stale"]})
+            clock.now = 61
+
+            def fail(params: dict[str, str]) -> dict[str, Any]:
+                raise JikenAPIError("API error occurred (status 503): Service Unavailable")
+
+            assert cache.get(PARAMS, fail) == {"data": ["stale"]}
+            assert cache.get(PARAMS, fail) == {"data": ["stale"]}
+
+    def test_prewarm_refreshes_entries_about_to_expire(self) -> None:
+        clock = FakeClock()
+        loader = CountingLoader()
+        cache = ResponseCache(ttl=60, prewarm_lead=10, clock=clock)
+        cache._warm[tuple(sorted(PARAMS.items()))] = (PARAMS, loader)
+
+        for future in cache.prewarm():
+            future.result()
+        clock.now = 40
+        assert cache.prewarm() == []
+
+        clock.now = 55
+        for future in cache.prewarm():
+            future.result()
+        cache.close()
+
+        assert loader.calls == 2
+        assert cache.get(PARAMS, loader)["version"] == 2
+
+    def test_keep_warm_loads_in_background(self) -> None:
+        loader = CountingLoader()
+        with ResponseCache(ttl=1.0, prewarm_lead=0.5) as cache:
+            cache.keep_warm(PARAMS, loader)
+            for _ in range(100):
+                if loader.calls:
+                    break
+                threading.Event().wait(0.01)
+
+        assert loader.calls >= 1
+
+    def test_invalidate(self) -> None:
+        loader = CountingLoader()
+        with ResponseCache(ttl=60, clock=FakeClock()) as cache:
+            cache.get(PARAMS, loader)
+            cache.invalidate(PARAMS)
+            cache.get(PARAMS, loader)
+            cache.invalidate()
+            cache.get(PARAMS, loader)
+
+        assert loader.calls == 3
+
+    def test_concurrent_misses_share_one_load(self) -> None:
+        loader = CountingLoader()
+        loader.release.clear()
+        results: list[dict[str, Any]] = []
+        with ResponseCache(ttl=60, clock=FakeClock()) as cache:
+            threads = [
+                threading.Thread(target=lambda: results.append(cache.get(PARAMS, loader)))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for _ in range(100):
+                if cache._loading:
+                    break
+                threading.Event().wait(0.01)
+            loader.release.set()
+            for thread in threads:
+                thread.join()
+
+        assert loader.calls == 1
+        assert [data["version"] for data in results] == [1, 1, 1, 1]
+
+    def test_failed_load_is_not_cached(self) -> None:
+        def fail(params: dict[str, str]) -> dict[str, Any]:
+            raise JikenAPIError("API error occurred (status 503): Service Unavailable")
+
+        loader = CountingLoader()
+        with ResponseCache(ttl=60, clock=FakeClock()) as cache:
+            with pytest.raises(JikenAPIError):
+                cache.get(PARAMS, fail)
+
+            assert cache.get(PARAMS, loader)["version"] == 1
+            assert cache._loading == {}
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        loader = CountingLoader()
+        with ResponseCache(ttl=60, max_entries=2, clock=FakeClock()) as cache:
+            cache.get({"year": "2022"}, loader)
+            cache.get({"year": "2023"}, loader)
+            cache.get({"year": "2022"}, loader)
+            cache.get({"year": "2024"}, loader)
+
+            assert len(cache._entries) == 2
+            cache.get({"year": "2022"}, loader)
+            assert loader.calls == 3
+            cache.get({"year": "2023"}, loader)
+            assert loader.calls == 4
+
+    def test_dead_entries_are_purged_first(self) -> None:
+        clock = FakeClock()
+        loader = CountingLoader()
+        with ResponseCache(ttl=60, stale_ttl=30, max_entries=2, clock=clock) as cache:
+            cache.get({"year": "2022"}, loader)
+            clock.now = 50
+            cache.get({"year": "2023"}, loader)
+            clock.now = 100
+            cache.get({"year": "2024"}, loader)
+
+            assert sorted(cache._entries) == [(("year", "2023"),), (("year", "2024"),)]
+
+    def test_invalid_ttl_raises_error(self) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            ResponseCache(ttl=0)
+
+        assert "TTL must be positive" in str(exc_info.value)
+
+    def test_negative_stale_ttl_raises_error(self) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            ResponseCache(stale_ttl=-1)
+
+        assert "Stale TTL must not be negative" in str(exc_info.value)
+
+    def test_invalid_max_entries_raises_error(self) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            ResponseCache(max_entries=0)
+
+        assert "max_entries must be at least 1" in str(exc_info.value)
+
+
+class TestClientWithCache:
+    def test_search_transactions_uses_cache(self) -> None:
+        transport = CountingTransport()
+        with ResponseCache(ttl=60) as cache:
+            client = JikenClient(api_key="test-key", transport=transport, cache=cache)
+            condition = SearchCondition(year=2024, area="13")
+
+            client.search_transactions(condition)
+            client.search_transactions(condition)
+
+        assert transport.calls == 1
+
+    def test_background_refresh_ignores_caller_deadline(self) -> None:
+        transport = CountingTransport()
+        clock = FakeClock()
+        with ResponseCache(ttl=60, stale_ttl=600, clock=clock) as cache:
+            client = JikenClient(api_key="test-key", transport=transport, cache=cache, timeout=30.0)
+            condition = SearchCondition(year=2024, area="13")
+
+            client.search_transactions(condition, deadline=5.0)
+            clock.now = 61
+            client.search_transactions(condition, deadline=0.02)
+            for future in list(cache._loading.values()):
+                future.result()
+
+        assert transport.timeouts == [30.0, 30.0]
+
+    @parameterized.expand(
+        [
+            (0.05, None),
+            (None, 0.05),
+        ]
+    )
+    def test_racing_misses_with_different_deadlines(
+        self, first_deadline: float | None, second_deadline: float | None
+    ) -> None:
+        transport = SlowTransport(0.3)
+        outcomes: dict[float | None, object] = {}
+        elapsed: dict[float | None, float] = {}
+
+        def search(deadline: float | None) -> None:
+            started = time.monotonic()
+            try:
+                outcomes[deadline] = client.search_transactions(condition, deadline=deadline)
+            except JikenTimeoutError as e:
+                outcomes[deadline] = e
+            elapsed[deadline] = time.monotonic() - started
+
+        with ResponseCache(ttl=60) as cache:
+            client = JikenClient(api_key="test-key", transport=transport, cache=cache)
+            condition = SearchCondition(year=2024, area="13")
+            first = threading.Thread(target=search, args=(first_deadline,))
+            first.start()
+            transport.started.wait(1.0)
+            second = threading.Thread(target=search, args=(second_deadline,))
+            second.start()
+            first.join()
+            second.join()
+
+        assert transport.calls == 1
+        assert outcomes[None] == []
+        assert isinstance(outcomes[0.05], JikenTimeoutError)
+        assert elapsed[0.05] < 0.2
+
+    def test_keep_warm_without_cache_raises_error(self) -> None:
+        client = JikenClient(api_key="test-key")
+
+        with pytest.raises(ValueError) as exc_info:
+            client.keep_warm([SearchCondition(year=2024, area="13")])
+
+        assert "keep_warm requires a client with a cache" in str(exc_info.value)
@@ -0,0 +1,92 @@
+import pytest
+from parameterized import parameterized
+
+from jiken.categories import PREFECTURES, PROPERTY_TYPES, STRUCTURES, parse_period
+
+
+class TestVocabulary:
+    def test_prefectures_follow_area_codes(self) -> None:
+        assert len(PREFECTURES) == 47
+        assert PREFECTURES.code("東京都") == 13
+        assert PREFECTURES.code("Tokyo") == 13
+        assert PREFECTURES.code("沖縄県") == 47
+
+    @parameterized.expand(
+        [
+            ("Tokyo-to", 13),
+            ("Osaka Prefecture", 27),
+            ("hokkaido", 1),
+            ("Hokkaido", 1),
+        ]
+    )
+    def test_prefecture_label_variants(self, label: str, code: int) -> None:
+        assert PREFECTURES.code(label) == code
+
+    @parameterized.expand(
+        [
+            ("宅地(土地と建物)", "Residential Land(Land and Building)"),
+            ("中古マンション等", "Pre-owned Condominiums, etc."),
+        ]
+    )
+    def test_property_type_labels_share_code(self, ja: str, en: str) -> None:
+        code = PROPERTY_TYPES.code(ja)
+
+        assert code is not None
+        assert PROPERTY_TYPES.code(en) == code
+        assert PROPERTY_TYPES.label(code, "ja") == ja
+        assert PROPERTY_TYPES.label(code, "en") == en
+
+    def test_full_width_structure(self) -> None:
+        assert STRUCTURES.code("ＲＣ") == STRUCTURES.code("RC") == 1
+        assert STRUCTURES.code("木造") == STRUCTURES.code("W")
+
+    @parameterized.expand([(None,), ("",), ("RC、W",), ("Unknown",)])
+    def test_unknown_label_has_no_code(self, label: str | None) -> None:
+        assert STRUCTURES.code(label) is None
+
+    def test_get(self) -> None:
+        category = PREFECTURES.get(27)
+
+        assert category is not None
+        assert (category.ja, category.en) == ("大阪府", "Osaka")
+        assert PREFECTURES.get(None) is None
+        assert PREFECTURES.get(48) is None
+        assert 13 in PREFECTURES
+
+    def test_label_unknown_code_raises_error(self) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            PREFECTURES.label(99, "en")
+
+        assert "Unknown code: 99" in str(exc_info.value)
+
+    def test_intern_returns_shared_instance(self) -> None:
+        label = "".join(["Tok", "yo"])
+
+        assert PREFECTURES.intern(label) is PREFECTURES.intern("Tokyo")
+        assert PREFECTURES.intern(None) is None
+
+        unknown = "".join(["Atlan", "tis"])
+        assert PREFECTURES.intern(unknown) is PREFECTURES.intern("Atlantis")
+
+    @parameterized.expand([("tokyo",), ("Tokyo-to",), ("rc",)])
+    def test_intern_keeps_label_variants(self, label: str) -> None:
+        assert PREFECTURES.intern(label) == label
+        assert STRUCTURES.intern(label) == label
+
+
+class TestParsePeriod:
+    @parameterized.expand(
+        [
+            ("2024Q1", (2024, 1)),
+            ("1st quarter 2024", (2024, 1)),
+            ("4th quarter 2023", (2023, 4)),
+            ("2024年第2四半期", (2024, 2)),
+            ("２０２４年第３四半期", (2024, 3)),
+        ]
+    )
+    def test_parse_period(self, period: str, expected: tuple[int, int]) -> None:
+        assert parse_period(period) == expected
+
+    @parameterized.expand([(None,), ("",), ("2024",), ("2024Q5",)])
+    def test_unrecognized_period(self, period: str | None) -> None:
+        assert parse_period(period) is None
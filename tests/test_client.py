@@ -1,5 +1,6 @@
 import gzip
 import json
+import time
 import urllib.error
 import urllib.request
 from email.message import Message
@@ -9,8 +10,16 @@ import pytest
 from parameterized import parameterized
 
 from jiken.client import JikenClient
-from jiken.exceptions import JikenAPIError, JikenAuthError, JikenRequestError
+from jiken.exceptions import (
+    JikenAPIError,
+    JikenAuthError,
+    JikenRateLimitError,
+    JikenRequestError,
+    JikenTimeoutError,
+)
+from jiken.hedging import HedgePolicy
 from jiken.models import SearchCondition, TradePrice
+from jiken.parser import Predicate
 
 
 class TestJikenClient:
@@ -44,7 +53,7 @@ class TestJikenClient:
         assert params["quarter"] == "1"
         assert params["language"] == "ja"
 
-    @patch("jiken.client.urlopen")
+    @patch("jiken.transport.urlopen")
     def test_fetch_data_success(self, mock_urlopen: Mock) -> None:
         response_data = {"data": [{"TradePrice": "50000000"}]}
         mock_response = MagicMock()
@@ -62,7 +71,7 @@ class TestJikenClient:
         assert result == response_data
         mock_urlopen.assert_called_once()
 
-    @patch("jiken.client.urlopen")
+    @patch("jiken.transport.urlopen")
     def test_fetch_data_with_gzip(self, mock_urlopen: Mock) -> None:
         response_data = {"data": [{"TradePrice": "50000000"}]}
         compressed_data = gzip.compress(json.dumps(response_data).encode("utf-8"))
@@ -81,7 +90,7 @@ class TestJikenClient:
 
         assert result == response_data
 
-    @patch("jiken.client.urlopen")
+    @patch("jiken.transport.urlopen")
     def test_fetch_data_auth_error(self, mock_urlopen: Mock) -> None:
         mock_urlopen.side_effect = urllib.error.HTTPError(
             url="http://test.com", code=401, msg="Unauthorized", hdrs=Message(), fp=None
@@ -95,7 +104,7 @@ class TestJikenClient:
 
         assert "Authentication failed" in str(exc_info.value)
 
-    @patch("jiken.client.urlopen")
+    @patch("jiken.transport.urlopen")
     def test_fetch_data_request_error(self, mock_urlopen: Mock) -> None:
         mock_urlopen.side_effect = urllib.error.HTTPError(
             url="http://test.com", code=400, msg="Bad Request", hdrs=Message(), fp=None
@@ -109,6 +118,147 @@ class TestJikenClient:
 
         assert "Invalid request parameters" in str(exc_info.value)
 
+    @patch("jiken.transport.urlopen")
+    def test_fetch_data_rate_limit_error(self, mock_urlopen: Mock) -> None:
+        mock_urlopen.side_effect = urllib.error.HTTPError(
+            url="http://test.com", code=429, msg="Too Many Requests", hdrs=Message(), fp=None
+        )
+
+        client = JikenClient(api_key="test-key")
+        params = {"year": "2024", "area": "13"}
+
+        with pytest.raises(JikenRateLimitError) as exc_info:
+            client._fetch_data(params)
+
+        assert "Rate limit exceeded" in str(exc_info.value)
+        assert exc_info.value.retry_after is None
+
+    @parameterized.expand(
+        [
+            ("30", 30.0),
+            ("Thu, 01 Jan 1970 00:00:00 GMT", 0.0),
+            ("soon", None),
+        ]
+    )
+    @patch("jiken.transport.urlopen")
+    def test_fetch_data_rate_limit_retry_after(
+        self, retry_after: str, expected: float | None, mock_urlopen: Mock
+    ) -> None:
+        headers = Message()
+        headers["Retry-After"] = retry_after
+        mock_urlopen.side_effect = urllib.error.HTTPError(
+            url="http://test.com", code=429, msg="Too Many Requests", hdrs=headers, fp=None
+        )
+
+        client = JikenClient(api_key="test-key")
+
+        with pytest.raises(JikenRateLimitError) as exc_info:
+            client._fetch_data({"year": "2024", "area": "13"})
+
+        assert exc_info.value.retry_after == expected
+
+    @patch("jiken.transport.urlopen")
+    def test_fetch_data_passes_timeout(self, mock_urlopen: Mock) -> None:
+        mock_response = MagicMock()
+        mock_response.read.return_value = b"{}"
+        mock_response.headers.get.return_value = None
+        mock_response.__enter__.return_value = mock_response
+        mock_response.__exit__.return_value = None
+        mock_urlopen.return_value = mock_response
+
+        client = JikenClient(api_key="test-key", timeout=5.0)
+        client._fetch_data({"year": "2024", "area": "13"})
+
+        assert mock_urlopen.call_args.kwargs["timeout"] == 5.0
+
+    @parameterized.expand(
+        [
+            (TimeoutError("timed out"),),
+            (urllib.error.URLError(TimeoutError("timed out")),),
+        ]
+    )
+    @patch("jiken.transport.urlopen")
+    def test_fetch_data_timeout_error(self, error: Exception, mock_urlopen: Mock) -> None:
+        mock_urlopen.side_effect = error
+
+        client = JikenClient(api_key="test-key")
+
+        with pytest.raises(JikenTimeoutError) as exc_info:
+            client._fetch_data({"year": "2024", "area": "13"})
+
+        assert "timed out" in str(exc_info.value)
+
+    @patch("jiken.transport.urlopen")
+    def test_search_transactions_deadline_bounds_timeout(self, mock_urlopen: Mock) -> None:
+        mock_response = MagicMock()
+        mock_response.read.return_value = b"{}"
+        mock_response.headers.get.return_value = None
+        mock_response.__enter__.return_value = mock_response
+        mock_response.__exit__.return_value = None
+        mock_urlopen.return_value = mock_response
+
+        client = JikenClient(api_key="test-key", timeout=30.0)
+        client.search_transactions(SearchCondition(year=2024, area="13"), deadline=2.0)
+
+        assert mock_urlopen.call_args.kwargs["timeout"] <= 2.0
+
+    def test_search_transactions_expired_deadline(self) -> None:
+        client = JikenClient(api_key="test-key")
+
+        with pytest.raises(JikenTimeoutError) as exc_info:
+            client.search_transactions(SearchCondition(year=2024, area="13"), deadline=0.0)
+
+        assert "Deadline exceeded" in str(exc_info.value)
+
+    @patch("jiken.transport.urlopen")
+    def test_search_transactions_deadline_bounds_slow_read(self, mock_urlopen: Mock) -> None:
+        # Each read returns within the socket timeout, but the response overruns the deadline
+        mock_response = MagicMock()
+        mock_response.read.side_effect = lambda: time.sleep(0.1) or b'{"data": []}'
+        mock_response.headers.get.return_value = None
+        mock_response.__enter__.return_value = mock_response
+        mock_response.__exit__.return_value = None
+        mock_urlopen.return_value = mock_response
+
+        client = JikenClient(api_key="test-key", timeout=30.0)
+
+        with pytest.raises(JikenTimeoutError) as exc_info:
+            client.search_transactions(SearchCondition(year=2024, area="13"), deadline=0.05)
+
+        assert "Deadline exceeded" in str(exc_info.value)
+
+    @patch("jiken.transport.urlopen")
+    def test_search_transactions_hedged_deadline(self, mock_urlopen: Mock) -> None:
+        mock_urlopen.side_effect = lambda request, timeout: time.sleep(0.5)
+
+        hedge = HedgePolicy(initial_delay=0.01)
+        client = JikenClient(api_key="test-key", hedge=hedge)
+
+        with pytest.raises(JikenTimeoutError):
+            client.search_transactions(SearchCondition(year=2024, area="13"), deadline=0.05)
+
+        assert hedge.hedges == 1
+        hedge.close()
+
+    @patch("jiken.transport.urlopen")
+    def test_search_transactions_bulk_is_not_hedged(self, mock_urlopen: Mock) -> None:
+        mock_response = MagicMock()
+        mock_response.read.return_value = b'{"data": []}'
+        mock_response.headers.get.return_value = None
+        mock_response.__enter__.return_value = mock_response
+        mock_response.__exit__.return_value = None
+        mock_urlopen.return_value = mock_response
+
+        hedge = HedgePolicy(initial_delay=0.0, min_delay=0.0)
+        client = JikenClient(api_key="test-key", hedge=hedge)
+        conditions = [SearchCondition(year=2024, area="13", quarter=q) for q in (1, 2)]
+
+        results = list(client.search_transactions_bulk(conditions, parse_workers=1))
+
+        assert len(results) == 2
+        assert hedge.requests == 0
+        hedge.close()
+
     @parameterized.expand(
         [
             (500, "Internal Server Error"),
@@ -116,7 +266,7 @@ class TestJikenClient:
             (503, "Service Unavailable"),
         ]
     )
-    @patch("jiken.client.urlopen")
+    @patch("jiken.transport.urlopen")
     def test_fetch_data_server_error(self, status_code: int, msg: str, mock_urlopen: Mock) -> None:
         mock_urlopen.side_effect = urllib.error.HTTPError(
             url="http://test.com", code=status_code, msg=msg, hdrs=Message(), fp=None
@@ -130,7 +280,7 @@ class TestJikenClient:
 
         assert f"status {status_code}" in str(exc_info.value)
 
-    @patch("jiken.client.urlopen")
+    @patch("jiken.transport.urlopen")
     def test_fetch_data_url_error(self, mock_urlopen: Mock) -> None:
         mock_urlopen.side_effect = urllib.error.URLError("Connection refused")
 
@@ -142,7 +292,7 @@ class TestJikenClient:
 
         assert "Failed to connect to API" in str(exc_info.value)
 
-    @patch("jiken.client.urlopen")
+    @patch("jiken.transport.urlopen")
     def test_fetch_data_invalid_json(self, mock_urlopen: Mock) -> None:
         mock_response = MagicMock()
         mock_response.read.return_value = b"invalid json"
@@ -280,7 +430,7 @@ class TestJikenClient:
         assert transactions[0].transaction_price == TradePrice(amount_jpy=50000000)
         assert transactions[1].transaction_price == TradePrice(amount_jpy=30000000)
 
-    @patch("jiken.client.urlopen")
+    @patch("jiken.transport.urlopen")
     def test_search_transactions_integration(self, mock_urlopen: Mock) -> None:
         response_data = {
             "data": [
@@ -317,3 +467,65 @@ class TestJikenClient:
         assert len(transactions) == 1
         assert transactions[0].transaction_price == TradePrice(amount_jpy=50000000)
         assert transactions[0].prefecture == "Tokyo"
+
+    @patch("jiken.transport.urlopen")
+    def test_search_transactions_bulk(self, mock_urlopen: Mock) -> None:
+        response_data = {
+            "data": [
+                {
+                    "TradePrice": "50000000",
+                    "Area": "100",
+                    "Prefecture": "Tokyo",
+                    "Type": "Residential Land",
+                    "Period": "2024Q1",
+                }
+            ]
+        }
+
+        mock_response = MagicMock()
+        mock_response.read.return_value = gzip.compress(json.dumps(response_data).encode("utf-8"))
+        mock_response.headers.get.return_value = "gzip"
+        mock_response.__enter__.return_value = mock_response
+        mock_response.__exit__.return_value = None
+        mock_urlopen.return_value = mock_response
+
+        client = JikenClient(api_key="test-key")
+        conditions = [SearchCondition(year=2024, area="13", quarter=q) for q in (1, 2)]
+
+        results = list(client.search_transactions_bulk(conditions, parse_workers=1))
+
+        assert sorted(condition.quarter or 0 for condition, _ in results) == [1, 2]
+        for _, transactions in results:
+            assert transactions[0].transaction_price == TradePrice(amount_jpy=50000000)
+            assert transactions[0].prefecture == "Tokyo"
+        assert mock_urlopen.call_count == 2
+
+    @patch("jiken.transport.urlopen")
+    def test_search_transactions_with_where_and_fields(self, mock_urlopen: Mock) -> None:
+        response_data = {
+            "data": [
+                {"TradePrice": "50000000", "Area": "100", "Type": "Residential Land"},
+                {"TradePrice": "5000000", "Area": "100", "Type": "Residential Land"},
+                {"TradePrice": "30000000", "Area": "60", "Type": "Apartment"},
+            ]
+        }
+
+        mock_response = MagicMock()
+        mock_response.read.return_value = json.dumps(response_data).encode("utf-8")
+        mock_response.headers.get.return_value = None
+        mock_response.__enter__.return_value = mock_response
+        mock_response.__exit__.return_value = None
+        mock_urlopen.return_value = mock_response
+
+        client = JikenClient(api_key="test-key")
+        condition = SearchCondition(year=2024, area="13")
+        where = [
+            Predicate("property_type", "==", "Residential Land"),
+            Predicate("transaction_price", ">", 10000000),
+        ]
+
+        transactions = client.search_transactions(condition, where=where)
+        records = client.search_transactions(condition, where=where, fields=["area"])
+
+        assert [t.transaction_price for t in transactions] == [TradePrice(amount_jpy=50000000)]
+        assert records == [{"area": 100.0}]
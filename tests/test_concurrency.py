@@ -0,0 +1,156 @@
+import threading
+
+import pytest
+from parameterized import parameterized
+
+from jiken.concurrency import AdaptiveLimiter
+from jiken.exceptions import JikenAPIError, JikenAuthError, JikenRateLimitError
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def run_request(limiter: AdaptiveLimiter, clock: FakeClock, latency: float) -> None:
+    started = limiter.acquire()
+    clock.now += latency
+    limiter.release(started)
+
+
+class TestAdaptiveLimiter:
+    def test_grows_while_latency_is_flat(self) -> None:
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(2, max_limit=10, clock=clock)
+
+        for _ in range(20):
+            run_request(limiter, clock, 0.1)
+
+        assert limiter.limit > 2
+
+    def test_never_exceeds_max_limit(self) -> None:
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(2, max_limit=3, clock=clock)
+
+        for _ in range(100):
+            run_request(limiter, clock, 0.1)
+
+        assert limiter.limit == 3
+
+    def test_backs_off_on_latency_spike(self) -> None:
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(8, clock=clock)
+
+        run_request(limiter, clock, 0.1)
+        run_request(limiter, clock, 1.0)
+
+        assert limiter.limit == 4
+
+    @parameterized.expand(
+        [
+            (JikenRateLimitError("Rate limit exceeded: Too Many Requests"),),
+            (JikenAPIError("API error occurred (status 503): Service Unavailable"),),
+        ]
+    )
+    def test_backs_off_on_overload(self, error: JikenAPIError) -> None:
+        limiter = AdaptiveLimiter(8, clock=FakeClock())
+
+        with pytest.raises(JikenAPIError), limiter.slot():
+            raise error
+
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+    def test_auth_error_does_not_change_limit(self) -> None:
+        limiter = AdaptiveLimiter(8, clock=FakeClock())
+
+        with pytest.raises(JikenAuthError), limiter.slot():
+            raise JikenAuthError("Authentication failed. Check your API key.")
+
+        assert limiter.limit == 8
+
+    def test_burst_of_errors_backs_off_once(self) -> None:
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(8, clock=clock)
+
+        starts = [limiter.acquire() for _ in range(4)]
+        clock.now += 0.1
+        for started in starts:
+            limiter.release(started, overloaded=True)
+
+        assert limiter.limit == 4
+
+    def test_respects_min_limit(self) -> None:
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(2, min_limit=2, clock=clock)
+
+        started = limiter.acquire()
+        limiter.release(started, overloaded=True)
+
+        assert limiter.limit == 2
+
+    def test_throughput(self) -> None:
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(4, window=10.0, clock=clock)
+
+        for _ in range(5):
+            run_request(limiter, clock, 1.0)
+
+        assert limiter.throughput == 0.5
+
+        clock.now += 20.0
+        assert limiter.throughput == 0.0
+
+    def test_acquire_blocks_at_limit(self) -> None:
+        limiter = AdaptiveLimiter(1)
+        started = limiter.acquire()
+        acquired = threading.Event()
+
+        def worker() -> None:
+            with limiter.slot():
+                acquired.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+
+        assert not acquired.wait(0.05)
+        limiter.release(started)
+        assert acquired.wait(1.0)
+        thread.join()
+
+    @parameterized.expand(
+        [
+            (0, 1, 64),
+            (4, 0, 64),
+            (4, 8, 64),
+            (10, 1, 5),
+        ]
+    )
+    def test_invalid_limits_raise_error(
+        self, initial_limit: int, min_limit: int, max_limit: int
+    ) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            AdaptiveLimiter(initial_limit, min_limit=min_limit, max_limit=max_limit)
+
+        assert "Limits must satisfy" in str(exc_info.value)
+
+    @parameterized.expand(
+        [
+            (0.0,),
+            (1.0,),
+        ]
+    )
+    def test_invalid_backoff_raises_error(self, backoff: float) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            AdaptiveLimiter(backoff=backoff)
+
+        assert "Backoff must be between 0 and 1" in str(exc_info.value)
+
+    def test_invalid_latency_tolerance_raises_error(self) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            AdaptiveLimiter(latency_tolerance=1.0)
+
+        assert "Latency tolerance must be greater than 1" in str(exc_info.value)
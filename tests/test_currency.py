@@ -0,0 +1,114 @@
+import pytest
+from parameterized import parameterized
+
+from jiken.currency import (
+    ExchangeRateTable,
+    convert_to_usd,
+    format_prices,
+    format_transaction_prices,
+)
+from jiken.models import TradePrice
+from tests.helpers import make_transaction
+
+
+class TestExchangeRateTable:
+    def test_rate_for_known_period(self) -> None:
+        rates = ExchangeRateTable({"2024Q1": 148.0})
+
+        assert rates.rate_for("2024Q1") == 148.0
+
+    def test_rate_for_unknown_period_uses_default(self) -> None:
+        rates = ExchangeRateTable({"2024Q1": 148.0}, default=110.0)
+
+        assert rates.rate_for("2020Q1") == 110.0
+
+    @parameterized.expand(
+        [
+            ("1st quarter 2024",),
+            ("2024年第1四半期",),
+        ]
+    )
+    def test_rate_for_matches_period_in_any_language(self, period: str) -> None:
+        rates = ExchangeRateTable({"2024Q1": 148.0})
+
+        assert rates.rate_for(period) == 148.0
+
+    def test_rate_keyed_by_year_and_quarter(self) -> None:
+        rates = ExchangeRateTable({(2024, 1): 148.0})
+
+        assert rates.rate_for("1st quarter 2024") == 148.0
+
+    def test_unrecognized_period_key_raises_error(self) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            ExchangeRateTable({"2024": 148.0})
+
+        assert "Unrecognized period: '2024'" in str(exc_info.value)
+
+    def test_rate_for_unknown_period_raises_error_by_default(self) -> None:
+        rates = ExchangeRateTable({"2024Q1": 148.0})
+
+        with pytest.raises(ValueError) as exc_info:
+            rates.rate_for("2020Q1")
+
+        assert "No exchange rate for period '2020Q1'" in str(exc_info.value)
+
+    @parameterized.expand(
+        [
+            ({"2024Q1": 0.0}, 150.0),
+            ({"2024Q1": -1.0}, 150.0),
+            ({}, 0.0),
+        ]
+    )
+    def test_non_positive_rate_raises_error(
+        self, rates: dict[str | tuple[int, int], float], default: float
+    ) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            ExchangeRateTable(rates, default=default)
+
+        assert "Exchange rates must be positive" in str(exc_info.value)
+
+
+class TestConvertToUsd:
+    def test_uses_rate_of_each_period(self) -> None:
+        rates = ExchangeRateTable({"2020Q1": 100.0, "2024Q1": 150.0})
+
+        result = convert_to_usd([50000000, 50000000], ["2020Q1", "2024Q1"], rates)
+
+        assert result == [500000, 333333]
+
+    def test_length_mismatch_raises_error(self) -> None:
+        with pytest.raises(ValueError):
+            convert_to_usd([1, 2], ["2024Q1"], ExchangeRateTable(default=150.0))
+
+
+class TestFormatPrices:
+    def test_ja_returns_jpy(self) -> None:
+        assert format_prices([50000000, 0], ["2024Q1", "2024Q1"], "ja") == ["¥50,000,000", "¥0"]
+
+    def test_en_matches_trade_price_format(self) -> None:
+        amounts = [50000000, 15000000, 300000]
+
+        result = format_prices(amounts, ["2024Q1"] * 3, "en")
+
+        assert result == [TradePrice(amount_jpy=amount).format("en") for amount in amounts]
+
+    def test_en_with_api_periods(self) -> None:
+        rates = ExchangeRateTable({"2024Q1": 148.6})
+
+        assert format_prices([148_600_000], ["1st quarter 2024"], "en", rates) == ["$1,000,000"]
+
+    def test_en_with_rate_table(self) -> None:
+        rates = ExchangeRateTable({"2020Q1": 100.0}, default=None)
+
+        assert format_prices([50000000], ["2020Q1"], "en", rates) == ["$500,000"]
+
+    def test_format_transaction_prices(self) -> None:
+        rates = ExchangeRateTable({"2020Q1": 100.0, "2024Q1": 150.0})
+        transactions = [
+            make_transaction(50000000, period="2020Q1"),
+            make_transaction(15000000, period="2024Q1"),
+        ]
+
+        result = format_transaction_prices(transactions, "en", rates)
+
+        assert result == ["$500,000", "$100,000"]
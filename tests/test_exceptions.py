@@ -4,7 +4,9 @@ from jiken.exceptions import (
     JikenAPIError,
     JikenAuthError,
     JikenError,
+    JikenRateLimitError,
     JikenRequestError,
+    JikenTimeoutError,
 )
 
 
@@ -28,6 +30,16 @@ def test_jiken_api_error_inheritance() -> None:
     assert issubclass(JikenAPIError, Exception)
 
 
+def test_jiken_rate_limit_error_inheritance() -> None:
+    assert issubclass(JikenRateLimitError, JikenAPIError)
+    assert issubclass(JikenRateLimitError, JikenError)
+
+
+def test_jiken_timeout_error_inheritance() -> None:
+    assert issubclass(JikenTimeoutError, JikenAPIError)
+    assert issubclass(JikenTimeoutError, JikenError)
+
+
 def test_raise_jiken_error() -> None:
     with pytest.raises(JikenError) as exc_info:
         raise JikenError("Test error")
@@ -0,0 +1,158 @@
+import threading
+import time
+
+import pytest
+from parameterized import parameterized
+
+from jiken.hedging import HedgePolicy
+
+
+class SlowThenFast:
+    """Callable whose first call is slow and later calls are fast."""
+
+    def __init__(self, slow: float) -> None:
+        self.slow = slow
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> int:
+        with self._lock:
+            self.calls += 1
+            call = self.calls
+        if call == 1:
+            time.sleep(self.slow)
+        return call
+
+
+class TestHedgePolicy:
+    def test_fast_call_is_not_hedged(self) -> None:
+        policy = HedgePolicy(initial_delay=0.5)
+
+        assert policy.run(lambda: "ok") == "ok"
+        assert policy.hedges == 0
+        assert policy.hedge_rate == 0.0
+        policy.close()
+
+    def test_slow_call_is_hedged(self) -> None:
+        policy = HedgePolicy(initial_delay=0.02)
+        call = SlowThenFast(slow=0.5)
+
+        result = policy.run(call)
+
+        assert result == 2
+        assert policy.hedges == 1
+        assert policy.hedge_wins == 1
+        assert policy.hedge_rate == 1.0
+        policy.close()
+
+    def test_no_hedging_without_samples_or_initial_delay(self) -> None:
+        policy = HedgePolicy()
+        call = SlowThenFast(slow=0.05)
+
+        assert policy.run(call) == 1
+        assert policy.hedges == 0
+        policy.close()
+
+    def test_delay_follows_latency_quantile(self) -> None:
+        policy = HedgePolicy(quantile=0.9, min_delay=0.0, window=10, min_samples=10)
+        policy._latencies.extend(i / 10 for i in range(1, 11))
+
+        assert policy.delay() == 1.0
+        policy.close()
+
+    def test_timeout_raises_timeout_error(self) -> None:
+        policy = HedgePolicy(initial_delay=0.01)
+
+        with pytest.raises(TimeoutError):
+            policy.run(lambda: time.sleep(0.5), timeout=0.05)
+
+        policy.close()
+
+    def test_error_is_raised_when_all_calls_fail(self) -> None:
+        policy = HedgePolicy()
+
+        def fail() -> None:
+            raise OSError("connection reset")
+
+        with pytest.raises(OSError) as exc_info:
+            policy.run(fail)
+
+        assert "connection reset" in str(exc_info.value)
+        policy.close()
+
+    def test_hedge_succeeds_after_primary_fails(self) -> None:
+        policy = HedgePolicy(initial_delay=0.02)
+        calls: list[int] = []
+
+        def call() -> str:
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.05)
+                raise OSError("connection reset")
+            return "ok"
+
+        assert policy.run(call) == "ok"
+        policy.close()
+
+    def test_timed_out_attempt_latency_is_recorded(self) -> None:
+        policy = HedgePolicy()
+
+        with pytest.raises(TimeoutError):
+            policy.run(lambda: time.sleep(0.2), timeout=0.05)
+
+        assert len(policy._latencies) == 1
+        assert policy._latencies[0] >= 0.04
+        policy.close()
+
+    def test_failed_attempt_latency_is_recorded(self) -> None:
+        policy = HedgePolicy()
+
+        def fail() -> None:
+            raise OSError("connection reset")
+
+        with pytest.raises(OSError):
+            policy.run(fail)
+
+        for _ in range(100):
+            if policy._latencies:
+                break
+            time.sleep(0.01)
+        assert len(policy._latencies) == 1
+        policy.close()
+
+    def test_latency_excludes_queue_time(self) -> None:
+        policy = HedgePolicy(max_workers=1)
+        policy._executor.submit(time.sleep, 0.1)
+
+        assert policy.run(lambda: "ok") == "ok"
+
+        for _ in range(100):
+            if policy._latencies:
+                break
+            time.sleep(0.01)
+        assert policy._latencies[0] < 0.05
+        policy.close()
+
+    @parameterized.expand(
+        [
+            (0.0,),
+            (1.0,),
+        ]
+    )
+    def test_invalid_quantile_raises_error(self, quantile: float) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            HedgePolicy(quantile)
+
+        assert "Quantile must be between 0 and 1" in str(exc_info.value)
+
+    @parameterized.expand(
+        [
+            (5, 10),
+            (10, 0),
+        ]
+    )
+    def test_invalid_window_raises_error(self, window: int, min_samples: int) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            HedgePolicy(window=window, min_samples=min_samples)
+
+        assert "Window must be at least min_samples" in str(exc_info.value)
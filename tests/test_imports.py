@@ -0,0 +1,94 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import jiken
+
+# Startup budget for importing the models used by short-lived workers (milliseconds)
+IMPORT_BUDGET_MS = float(os.environ.get("JIKEN_IMPORT_BUDGET_MS", "100"))
+
+HEAVY_MODULES = (
+    "urllib.request",
+    "http.client",
+    "ssl",
+    "email",
+    "multiprocessing",
+    "concurrent.futures",
+)
+
+THREAD_MODULES = ("multiprocessing", "concurrent.futures")
+
+
+def run_python(code: str, *options: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_models_do_not_import_heavy_modules() -> None:
+    code = (
+        "import sys\n"
+        "from jiken import SearchCondition, Transaction\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+
+    result = run_python(code)
+
+    assert result.stdout.strip() == ""
+
+
+def test_client_is_loaded_on_first_access() -> None:
+    code = (
+        "import sys\n"
+        "import jiken\n"
+        "assert 'jiken.client' not in sys.modules\n"
+        "jiken.JikenClient\n"
+        "assert 'jiken.client' in sys.modules\n"
+    )
+
+    run_python(code)
+
+
+def test_client_does_not_import_thread_pools() -> None:
+    code = (
+        "import sys\n"
+        "import jiken.client\n"
+        f"print(','.join(m for m in {THREAD_MODULES!r} if m in sys.modules))\n"
+    )
+
+    result = run_python(code)
+
+    assert result.stdout.strip() == ""
+
+
+def test_import_time_within_budget() -> None:
+    result = run_python("from jiken import SearchCondition, Transaction", "-X", "importtime")
+
+    # Lines look like "import time:  self [us] | cumulative | name"; top-level
+    # entries have no indentation before the module name.
+    total_us = 0
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].startswith(" jiken") and fields[1].strip().isdigit():
+            total_us += int(fields[1])
+
+    assert 0 < total_us / 1000 < IMPORT_BUDGET_MS
+
+
+def test_lazy_attributes() -> None:
+    from jiken.client import JikenClient
+
+    assert jiken.JikenClient is JikenClient
+    assert set(jiken.__all__) <= set(dir(jiken))
+
+
+def test_unknown_attribute_raises_error() -> None:
+    with pytest.raises(AttributeError) as exc_info:
+        jiken.NotAnAttribute  # noqa: B018
+
+    assert "has no attribute 'NotAnAttribute'" in str(exc_info.value)
@@ -214,3 +214,60 @@ class TestTransaction:
 
         price_per_sqm = transaction.transaction_price.amount_jpy / transaction.area
         assert price_per_sqm == 500000.0
+
+    def test_price_per_sqm(self) -> None:
+        transaction = Transaction(
+            transaction_price=TradePrice(amount_jpy=50000000),
+            area=100.0,
+            unit_price=None,
+            prefecture="Tokyo",
+            city="Shibuya-ku",
+            district=None,
+            building_year=None,
+            property_type="Residential Land",
+            structure=None,
+            floor_area_ratio=None,
+            building_coverage=None,
+            frontage_road_width=None,
+            transaction_period="2024Q1",
+        )
+
+        assert transaction.price_per_sqm == 500000.0
+
+    def test_price_per_sqm_without_area(self) -> None:
+        transaction = Transaction(
+            transaction_price=TradePrice(amount_jpy=50000000),
+            area=0.0,
+            unit_price=None,
+            prefecture="Tokyo",
+            city="Shibuya-ku",
+            district=None,
+            building_year=None,
+            property_type="Residential Land",
+            structure=None,
+            floor_area_ratio=None,
+            building_coverage=None,
+            frontage_road_width=None,
+            transaction_period="2024Q1",
+        )
+
+        assert transaction.price_per_sqm is None
+
+    def test_price_per_sqm_without_price(self) -> None:
+        transaction = Transaction(
+            transaction_price=TradePrice(amount_jpy=0),
+            area=100.0,
+            unit_price=None,
+            prefecture="Tokyo",
+            city="Shibuya-ku",
+            district=None,
+            building_year=None,
+            property_type="Residential Land",
+            structure=None,
+            floor_area_ratio=None,
+            building_coverage=None,
+            frontage_road_width=None,
+            transaction_period="2024Q1",
+        )
+
+        assert transaction.price_per_sqm is None
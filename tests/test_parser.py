@@ -0,0 +1,259 @@
+import gzip
+import json
+
+import pytest
+from parameterized import parameterized
+
+from jiken.exceptions import JikenAPIError
+from jiken.models import TradePrice
+from jiken.parser import (
+    Predicate,
+    decode_response,
+    parse_columns,
+    parse_records,
+    parse_transactions,
+    records_from_columns,
+    transactions_from_columns,
+)
+
+RESPONSE_DATA = {
+    "data": [
+        {
+            "TradePrice": "50000000",
+            "Area": "100",
+            "UnitPrice": None,
+            "Prefecture": "Tokyo",
+            "Municipality": "Shibuya-ku",
+            "DistrictName": None,
+            "BuildingYear": "2020",
+            "Type": "Residential Land",
+            "Structure": None,
+            "FloorAreaRatio": None,
+            "CoverageRatio": None,
+            "Frontage": None,
+            "Period": "2024Q1",
+        },
+        {
+            "TradePrice": "30000000",
+            "Area": "60",
+            "UnitPrice": None,
+            "Prefecture": "Osaka",
+            "Municipality": "Osaka-shi",
+            "DistrictName": None,
+            "BuildingYear": "2018",
+            "Type": "Apartment",
+            "Structure": "RC",
+            "FloorAreaRatio": "200",
+            "CoverageRatio": "60",
+            "Frontage": "5",
+            "Period": "2024Q1",
+        },
+    ]
+}
+
+
+MIXED_LANGUAGE_DATA = {
+    "data": [
+        {
+            "TradePrice": "50000000",
+            "Prefecture": "東京都",
+            "Municipality": "渋谷区",
+            "Type": "中古マンション等",
+            "Structure": "ＲＣ",
+            "Period": "2024年第1四半期",
+        },
+        {
+            "TradePrice": "40000000",
+            "Prefecture": "Tokyo",
+            "Municipality": "Shibuya Ward",
+            "Type": "Pre-owned Condominiums, etc.",
+            "Structure": "RC",
+            "Period": "1st quarter 2024",
+        },
+    ]
+}
+
+
+class TestDecodeResponse:
+    def test_plain_json(self) -> None:
+        body = json.dumps(RESPONSE_DATA).encode("utf-8")
+
+        assert decode_response(body, None) == RESPONSE_DATA
+
+    def test_gzip_json(self) -> None:
+        body = gzip.compress(json.dumps(RESPONSE_DATA).encode("utf-8"))
+
+        assert decode_response(body, "gzip") == RESPONSE_DATA
+
+    def test_invalid_gzip_raises_error(self) -> None:
+        with pytest.raises(JikenAPIError) as exc_info:
+            decode_response(b"not gzip", "gzip")
+
+        assert "Failed to parse API response" in str(exc_info.value)
+
+
+class TestParseColumns:
+    def test_columns_match_transactions(self) -> None:
+        body = gzip.compress(json.dumps(RESPONSE_DATA).encode("utf-8"))
+
+        columns = parse_columns(body, "gzip")
+
+        assert columns[0] == [50000000, 30000000]
+        assert transactions_from_columns(columns) == parse_transactions(RESPONSE_DATA)
+
+    def test_empty_response(self) -> None:
+        columns = parse_columns(b"{}", None)
+
+        assert transactions_from_columns(columns) == []
+
+    def test_rebuilds_trade_price(self) -> None:
+        columns = parse_columns(json.dumps(RESPONSE_DATA).encode("utf-8"), None)
+
+        transactions = transactions_from_columns(columns)
+
+        assert transactions[1].transaction_price == TradePrice(amount_jpy=30000000)
+        assert transactions[1].structure == "RC"
+
+
+class TestPredicate:
+    @parameterized.expand(
+        [
+            (Predicate("property_type", "==", "Apartment"), [30000000]),
+            (Predicate("property_type", "!=", "Apartment"), [50000000]),
+            (Predicate("transaction_price", ">", 40000000), [50000000]),
+            (Predicate("transaction_price", "<=", 30000000), [30000000]),
+            (Predicate("prefecture", "in", {"Tokyo", "Kyoto"}), [50000000]),
+            (Predicate("floor_area_ratio", ">=", 100), [30000000]),
+            (Predicate("structure", "==", None), [50000000]),
+        ]
+    )
+    def test_filters_items(self, predicate: Predicate, expected: list[int]) -> None:
+        transactions = parse_transactions(RESPONSE_DATA, (predicate,))
+
+        assert [t.transaction_price.amount_jpy for t in transactions] == expected
+
+    def test_predicates_are_combined(self) -> None:
+        where = (
+            Predicate("transaction_price", ">", 10000000),
+            Predicate("property_type", "==", "Residential Land"),
+        )
+
+        assert len(parse_transactions(RESPONSE_DATA, where)) == 1
+
+    @parameterized.expand(
+        [
+            ("price", "==", "Unknown field: 'price'"),
+            ("area", "~", "Unknown operator: '~'"),
+        ]
+    )
+    def test_invalid_predicate_raises_error(self, field: str, op: str, message: str) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            Predicate(field, op, 1)
+
+        assert message in str(exc_info.value)
+
+    @parameterized.expand(
+        [
+            (Predicate("transaction_price", "<", 1000000),),
+            (Predicate("transaction_price", ">=", 0),),
+            (Predicate("area", "<", 10),),
+        ]
+    )
+    def test_missing_price_or_area_never_matches_ordering(self, predicate: Predicate) -> None:
+        data = {"data": [{"TradePrice": "", "Prefecture": "Tokyo", "Period": "2024Q1"}]}
+
+        assert parse_transactions(data, (predicate,)) == []
+
+    @parameterized.expand(
+        [
+            ("city", ">", 5, "Cannot compare 'city' with int using '>'"),
+            ("transaction_price", "<", "1000000", "Cannot compare 'transaction_price' with str"),
+            ("area", ">=", True, "Cannot compare 'area' with bool"),
+            ("prefecture", "in", "Tokyo", "Value of 'in' must be a collection"),
+            ("period_year", "in", 2024, "Value of 'in' must be a collection"),
+        ]
+    )
+    def test_mismatched_value_type_raises_error(
+        self, field: str, op: str, value: object, message: str
+    ) -> None:
+        with pytest.raises(TypeError) as exc_info:
+            Predicate(field, op, value)
+
+        assert message in str(exc_info.value)
+
+
+class TestProjection:
+    def test_parse_records(self) -> None:
+        records = parse_records(
+            RESPONSE_DATA,
+            ["transaction_price", "city"],
+            (Predicate("property_type", "==", "Apartment"),),
+        )
+
+        assert records == [{"transaction_price": 30000000, "city": "Osaka-shi"}]
+
+    def test_parse_records_unknown_field_raises_error(self) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            parse_records(RESPONSE_DATA, ["price"])
+
+        assert "Unknown field: 'price'" in str(exc_info.value)
+
+    def test_parse_columns_with_projection(self) -> None:
+        body = json.dumps(RESPONSE_DATA).encode("utf-8")
+        fields = ("area", "property_type")
+
+        columns = parse_columns(
+            body, None, (Predicate("transaction_price", ">", 40000000),), fields
+        )
+
+        assert records_from_columns(columns, fields) == [
+            {"area": 100.0, "property_type": "Residential Land"}
+        ]
+
+
+class TestCanonicalCodes:
+    def test_codes_match_across_languages(self) -> None:
+        ja, en = parse_transactions(MIXED_LANGUAGE_DATA)
+
+        for transaction in (ja, en):
+            assert transaction.prefecture_code == 13
+            assert transaction.property_type_code == 3
+            assert transaction.structure_code == 1
+            assert (transaction.period_year, transaction.period_quarter) == (2024, 1)
+
+        assert (ja.prefecture, en.prefecture) == ("東京都", "Tokyo")
+
+    def test_unknown_labels_have_no_code(self) -> None:
+        transactions = parse_transactions(RESPONSE_DATA)
+
+        assert transactions[0].prefecture_code == 13
+        assert transactions[0].property_type_code is None
+        assert transactions[0].structure_code is None
+        assert transactions[1].period_year == 2024
+
+    def test_categorical_strings_are_shared(self) -> None:
+        data = json.loads(json.dumps({"data": RESPONSE_DATA["data"] * 2}))
+
+        first, _, third, _ = parse_transactions(data)
+
+        assert first.city is third.city
+        assert first.transaction_period is third.transaction_period
+
+    def test_predicate_on_code(self) -> None:
+        where = [Predicate("property_type_code", "==", 3), Predicate("period_year", ">=", 2024)]
+
+        assert len(parse_transactions(MIXED_LANGUAGE_DATA, where)) == 2
+
+    def test_columns_include_codes(self) -> None:
+        body = json.dumps(MIXED_LANGUAGE_DATA).encode("utf-8")
+
+        columns = parse_columns(body, None)
+
+        assert transactions_from_columns(columns) == parse_transactions(MIXED_LANGUAGE_DATA)
+        assert records_from_columns(
+            parse_columns(body, None, fields=["prefecture_code", "period_quarter"]),
+            ["prefecture_code", "period_quarter"],
+        ) == [
+            {"prefecture_code": 13, "period_quarter": 1},
+            {"prefecture_code": 13, "period_quarter": 1},
+        ]
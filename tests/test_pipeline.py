@@ -0,0 +1,176 @@
+import gzip
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from jiken.concurrency import AdaptiveLimiter
+from jiken.exceptions import JikenAPIError, JikenRateLimitError
+from jiken.models import SearchCondition
+from jiken.parser import Predicate
+from jiken.pipeline import ParsePipeline
+
+
+def build_params(condition: SearchCondition) -> dict[str, str]:
+    return {"year": str(condition.year), "area": condition.area or ""}
+
+
+def make_body(year: int) -> bytes:
+    data = {"data": [{"TradePrice": str(year), "Area": "100", "Period": f"{year}Q1"}]}
+    return gzip.compress(json.dumps(data).encode("utf-8"))
+
+
+class CountingFetcher:
+    def __init__(self) -> None:
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, params: dict[str, str]) -> tuple[bytes, str | None]:
+        with self._lock:
+            self.calls += 1
+        return make_body(int(params["year"])), "gzip"
+
+
+class TestParsePipeline:
+    def test_yields_every_condition(self) -> None:
+        conditions = [SearchCondition(year=year, area="13") for year in range(2015, 2025)]
+
+        with ThreadPoolExecutor(2) as executor:
+            pipeline = ParsePipeline(CountingFetcher(), parse_executor=executor)
+            results = list(pipeline.run(conditions, build_params))
+
+        assert len(results) == 10
+        for condition, columns in results:
+            assert columns[0] == [condition.year]
+
+    def test_where_and_fields_are_pushed_down(self) -> None:
+        conditions = [SearchCondition(year=year, area="13") for year in (2023, 2024)]
+        where = (Predicate("transaction_price", ">", 2023),)
+
+        with ThreadPoolExecutor(1) as executor:
+            pipeline = ParsePipeline(CountingFetcher(), parse_executor=executor)
+            results = list(pipeline.run(conditions, build_params, where, ["transaction_period"]))
+
+        columns = sorted(columns for _, columns in results)
+        assert columns == [([],), (["2024Q1"],)]
+
+    def test_empty_conditions(self) -> None:
+        pipeline = ParsePipeline(CountingFetcher())
+
+        assert list(pipeline.run([], build_params)) == []
+
+    def test_max_pending_bounds_fetches(self) -> None:
+        fetcher = CountingFetcher()
+        conditions = [SearchCondition(year=year, area="13") for year in range(2000, 2020)]
+
+        with ThreadPoolExecutor(2) as executor:
+            pipeline = ParsePipeline(
+                fetcher, fetch_workers=4, max_pending=2, parse_executor=executor
+            )
+            results = pipeline.run(conditions, build_params)
+            next(results)
+            time.sleep(0.1)
+
+            assert fetcher.calls <= 3
+            results.close()
+
+    def test_fetch_error_propagates(self) -> None:
+        def fetch_raw(params: dict[str, str]) -> tuple[bytes, str | None]:
+            raise JikenAPIError("API error occurred (status 503): Service Unavailable")
+
+        with ThreadPoolExecutor(1) as executor:
+            pipeline = ParsePipeline(fetch_raw, parse_executor=executor)
+
+            with pytest.raises(JikenAPIError):
+                list(pipeline.run([SearchCondition(year=2024, area="13")], build_params))
+
+    def test_parse_error_propagates(self) -> None:
+        with ThreadPoolExecutor(1) as executor:
+            pipeline = ParsePipeline(lambda params: (b"invalid", None), parse_executor=executor)
+
+            with pytest.raises(JikenAPIError) as exc_info:
+                list(pipeline.run([SearchCondition(year=2024, area="13")], build_params))
+
+        assert "Failed to parse API response" in str(exc_info.value)
+
+    def test_process_pool(self) -> None:
+        conditions = [SearchCondition(year=2023, area="13"), SearchCondition(year=2024, area="13")]
+        pipeline = ParsePipeline(CountingFetcher(), parse_workers=1)
+
+        results = list(pipeline.run(conditions, build_params))
+
+        assert sorted(columns[0][0] for _, columns in results) == [2023, 2024]
+
+    def test_invalid_fetch_workers_raises_error(self) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            ParsePipeline(CountingFetcher(), fetch_workers=0)
+
+        assert "fetch_workers must be at least 1" in str(exc_info.value)
+
+    def test_invalid_max_pending_raises_error(self) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            ParsePipeline(CountingFetcher(), max_pending=0)
+
+        assert "max_pending must be at least 1" in str(exc_info.value)
+
+    def test_limiter_retries_rate_limited_fetch(self) -> None:
+        fetcher = CountingFetcher()
+        failures = [JikenRateLimitError("Rate limit exceeded: Too Many Requests")]
+
+        def fetch_raw(params: dict[str, str]) -> tuple[bytes, str | None]:
+            if failures:
+                raise failures.pop()
+            return fetcher(params)
+
+        limiter = AdaptiveLimiter(4, max_limit=4)
+        delays: list[float] = []
+
+        with ThreadPoolExecutor(1) as executor:
+            pipeline = ParsePipeline(
+                fetch_raw, parse_executor=executor, limiter=limiter, sleep=delays.append
+            )
+            results = list(pipeline.run([SearchCondition(year=2024, area="13")], build_params))
+
+        assert results[0][1][0] == [2024]
+        assert limiter.limit == 2
+        assert limiter.in_flight == 0
+        assert delays == [0.5]
+
+    def test_rate_limit_retries_back_off(self) -> None:
+        failures = [
+            JikenRateLimitError("Rate limit exceeded: Too Many Requests", retry_after=7.0),
+            JikenRateLimitError("Rate limit exceeded: Too Many Requests"),
+            JikenRateLimitError("Rate limit exceeded: Too Many Requests"),
+        ]
+
+        def fetch_raw(params: dict[str, str]) -> tuple[bytes, str | None]:
+            if failures:
+                raise failures.pop()
+            return make_body(2024), "gzip"
+
+        delays: list[float] = []
+
+        with ThreadPoolExecutor(1) as executor:
+            pipeline = ParsePipeline(
+                fetch_raw, parse_executor=executor, limiter=AdaptiveLimiter(), sleep=delays.append
+            )
+            list(pipeline.run([SearchCondition(year=2024, area="13")], build_params))
+
+        assert delays == [0.5, 1.0, 7.0]
+
+    def test_rate_limit_retries_are_bounded(self) -> None:
+        def fetch_raw(params: dict[str, str]) -> tuple[bytes, str | None]:
+            raise JikenRateLimitError("Rate limit exceeded: Too Many Requests")
+
+        delays: list[float] = []
+
+        with ThreadPoolExecutor(1) as executor:
+            pipeline = ParsePipeline(
+                fetch_raw, parse_executor=executor, limiter=AdaptiveLimiter(), sleep=delays.append
+            )
+            with pytest.raises(JikenRateLimitError):
+                list(pipeline.run([SearchCondition(year=2024, area="13")], build_params))
+
+        assert delays == [0.5, 1.0, 2.0]
@@ -0,0 +1,105 @@
+import pytest
+
+from jiken.models import SearchCondition, Transaction
+from jiken.query import TopKQuery
+from tests.helpers import make_transaction
+
+
+def prices(transactions: list[Transaction]) -> list[int]:
+    return [transaction.transaction_price.amount_jpy for transaction in transactions]
+
+
+class TestTopKQuery:
+    def test_keeps_cheapest_per_sqm(self) -> None:
+        query = TopKQuery(3)
+
+        query.update(make_transaction(amount) for amount in (50, 10, 40, 20, 30, 60))
+
+        assert prices(query.top()) == [10, 20, 30]
+        assert query.scanned == 6
+
+    def test_missing_price_is_not_ranked_cheapest(self) -> None:
+        query = TopKQuery(1)
+
+        query.update([make_transaction(30000000), make_transaction(0)])
+
+        assert prices(query.top()) == [30000000]
+
+    def test_keeps_largest(self) -> None:
+        query = TopKQuery(2, largest=True)
+
+        query.update(make_transaction(amount) for amount in (50, 10, 40, 20))
+
+        assert prices(query.top()) == [50, 40]
+
+    def test_groups(self) -> None:
+        query = TopKQuery(1, group_by=lambda transaction: transaction.property_type)
+
+        query.update(
+            [
+                make_transaction(30, property_type="Residential Land"),
+                make_transaction(10, property_type="Residential Land"),
+                make_transaction(20, property_type="Apartment"),
+            ]
+        )
+
+        results = query.results()
+        assert prices(results["Residential Land"]) == [10]
+        assert prices(results["Apartment"]) == [20]
+
+    def test_where_and_missing_key_are_skipped(self) -> None:
+        query = TopKQuery(5, where=lambda transaction: transaction.property_type == "Apartment")
+
+        query.update(
+            [
+                make_transaction(10, property_type="Residential Land"),
+                make_transaction(20, area=0.0, property_type="Apartment"),
+                make_transaction(30, property_type="Apartment"),
+            ]
+        )
+
+        assert prices(query.top()) == [30]
+
+    def test_consume_bulk_results(self) -> None:
+        condition = SearchCondition(year=2024, area="13")
+        results = [
+            (condition, [make_transaction(30), make_transaction(10)]),
+            (condition, [make_transaction(20)]),
+        ]
+
+        query = TopKQuery(2).consume(iter(results))
+
+        assert prices(query.top()) == [10, 20]
+
+    def test_memory_is_bounded(self) -> None:
+        query = TopKQuery(10)
+
+        query.update(make_transaction(amount) for amount in range(10000, 0, -1))
+
+        assert len(query._heaps[None]) == 10
+        assert prices(query.top()) == list(range(1, 11))
+
+    def test_threshold_and_below_percentile(self) -> None:
+        query = TopKQuery(50)
+
+        query.update(make_transaction(amount * 100) for amount in range(1, 101))
+
+        threshold = query.threshold(0.1)
+        assert threshold is not None
+        assert threshold == pytest.approx(10.0, rel=0.02)
+        below = query.below_percentile(0.1)[None]
+        assert 9 <= len(below) <= 11
+        assert all((transaction.price_per_sqm or 0) <= threshold for transaction in below)
+
+    def test_empty_query(self) -> None:
+        query = TopKQuery(5)
+
+        assert query.top() == []
+        assert query.results() == {}
+        assert query.threshold(0.5) is None
+
+    def test_invalid_k_raises_error(self) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            TopKQuery(0)
+
+        assert "k must be at least 1" in str(exc_info.value)
@@ -0,0 +1,121 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from jiken.rollup import PriceIndexRollup
+from tests.helpers import make_transaction
+
+
+class TestPriceIndexRollup:
+    def test_update_groups_by_city_type_and_period(self, tmp_path: Path) -> None:
+        rollup = PriceIndexRollup(tmp_path / "rollup.json")
+
+        touched = rollup.update(
+            [
+                make_transaction(10000000, 100),
+                make_transaction(30000000, 100),
+                make_transaction(50000000, 100),
+                make_transaction(20000000, 100, city="Minato-ku"),
+                make_transaction(20000000, 0),
+                make_transaction(0, 100),
+            ]
+        )
+
+        assert touched == {
+            ("Tokyo", "Shibuya-ku", "Residential Land", "2024Q1"),
+            ("Tokyo", "Minato-ku", "Residential Land", "2024Q1"),
+        }
+        group = rollup.get("Tokyo", "Shibuya-ku", "Residential Land", "2024Q1")
+        assert group is not None
+        assert group.count == 3
+        assert group.median_price_per_sqm == pytest.approx(300000, rel=0.01)
+
+    def test_same_city_name_in_different_prefectures(self, tmp_path: Path) -> None:
+        rollup = PriceIndexRollup(tmp_path / "rollup.json")
+        rollup.update(
+            [
+                make_transaction(amount, 100, prefecture="Tokyo", city="Fuchu City")
+                for amount in (40000000, 50000000, 60000000)
+            ]
+        )
+
+        rollup.update([make_transaction(4950000, 100, prefecture="Hiroshima", city="Fuchu City")])
+
+        tokyo = rollup.get("Tokyo", "Fuchu City", "Residential Land", "2024Q1")
+        hiroshima = rollup.get("Hiroshima", "Fuchu City", "Residential Land", "2024Q1")
+        assert tokyo is not None and hiroshima is not None
+        assert tokyo.count == 3
+        assert tokyo.median_price_per_sqm == pytest.approx(500000, rel=0.01)
+        assert hiroshima.count == 1
+
+    def test_update_only_recomputes_touched_groups(self, tmp_path: Path) -> None:
+        rollup = PriceIndexRollup(tmp_path / "rollup.json")
+        rollup.update([make_transaction(10000000, 100, period="2024Q1")])
+        before = rollup.get("Tokyo", "Shibuya-ku", "Residential Land", "2024Q1")
+
+        touched = rollup.update([make_transaction(20000000, 100, period="2024Q2")])
+
+        assert touched == {("Tokyo", "Shibuya-ku", "Residential Land", "2024Q2")}
+        assert rollup.get("Tokyo", "Shibuya-ku", "Residential Land", "2024Q1") is before
+        assert len(rollup) == 2
+
+    def test_refetch_replaces_group(self, tmp_path: Path) -> None:
+        rollup = PriceIndexRollup(tmp_path / "rollup.json")
+        batch = [make_transaction(10000000, 100), make_transaction(30000000, 100)]
+
+        rollup.update(batch)
+        rollup.update(batch)
+
+        group = rollup.get("Tokyo", "Shibuya-ku", "Residential Land", "2024Q1")
+        assert group is not None
+        assert group.count == 2
+
+    def test_merge_adds_to_group(self, tmp_path: Path) -> None:
+        rollup = PriceIndexRollup(tmp_path / "rollup.json")
+
+        rollup.update([make_transaction(10000000, 100)])
+        rollup.update([make_transaction(30000000, 100)], replace=False)
+
+        group = rollup.get("Tokyo", "Shibuya-ku", "Residential Land", "2024Q1")
+        assert group is not None
+        assert group.count == 2
+
+    def test_save_and_load(self, tmp_path: Path) -> None:
+        path = tmp_path / "rollups" / "rollup.json"
+        rollup = PriceIndexRollup(path)
+        rollup.update([make_transaction(10000000, 100), make_transaction(30000000, 100)])
+        rollup.save()
+
+        restored = PriceIndexRollup(path)
+
+        assert list(restored) == list(rollup)
+        assert restored.median_price_per_sqm(
+            "Tokyo", "Shibuya-ku", "Residential Land", "2024Q1"
+        ) == rollup.median_price_per_sqm("Tokyo", "Shibuya-ku", "Residential Land", "2024Q1")
+
+    def test_unknown_group(self, tmp_path: Path) -> None:
+        rollup = PriceIndexRollup(tmp_path / "rollup.json")
+
+        assert rollup.get("Tokyo", "Chiyoda-ku", "Residential Land", "2024Q1") is None
+        assert (
+            rollup.median_price_per_sqm("Tokyo", "Chiyoda-ku", "Residential Land", "2024Q1") is None
+        )
+
+    def test_unsupported_version_raises_error(self, tmp_path: Path) -> None:
+        path = tmp_path / "rollup.json"
+        path.write_text(json.dumps({"version": 99, "groups": []}))
+
+        with pytest.raises(ValueError) as exc_info:
+            PriceIndexRollup(path)
+
+        assert "Unsupported rollup file version: 99" in str(exc_info.value)
+
+    def test_city_only_version_1_file_raises_error(self, tmp_path: Path) -> None:
+        path = tmp_path / "rollup.json"
+        path.write_text(json.dumps({"version": 1, "groups": []}))
+
+        with pytest.raises(ValueError) as exc_info:
+            PriceIndexRollup(path)
+
+        assert "Unsupported rollup file version: 1" in str(exc_info.value)
@@ -0,0 +1,81 @@
+import random
+
+import pytest
+from parameterized import parameterized
+
+from jiken.sketch import QuantileSketch
+
+
+class TestQuantileSketch:
+    @parameterized.expand(
+        [
+            (0.1,),
+            (0.5,),
+            (0.9,),
+            (0.99,),
+        ]
+    )
+    def test_quantile_within_relative_accuracy(self, q: float) -> None:
+        rng = random.Random(0)
+        values = sorted(rng.lognormvariate(13, 1) for _ in range(10000))
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        expected = values[int(q * (len(values) - 1))]
+        estimate = sketch.quantile(q)
+
+        assert estimate is not None
+        assert abs(estimate - expected) <= 0.01 * expected
+
+    def test_empty_sketch(self) -> None:
+        assert QuantileSketch().quantile(0.5) is None
+
+    def test_zero_values(self) -> None:
+        sketch = QuantileSketch()
+        for value in (0.0, 0.0, 100.0):
+            sketch.add(value)
+
+        assert sketch.quantile(0.0) == 0.0
+        assert sketch.quantile(1.0) == pytest.approx(100.0, rel=0.01)
+
+    def test_merge_equals_combined(self) -> None:
+        left, right, combined = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for value in range(1, 101):
+            (left if value % 2 else right).add(value)
+            combined.add(value)
+
+        left.merge(right)
+
+        assert left.count == 100
+        assert left.to_dict() == combined.to_dict()
+
+    def test_merge_different_accuracy_raises_error(self) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            QuantileSketch(0.01).merge(QuantileSketch(0.02))
+
+        assert "different relative accuracy" in str(exc_info.value)
+
+    def test_round_trip(self) -> None:
+        sketch = QuantileSketch()
+        for value in (0.0, 1.5, 300.0, 300.0):
+            sketch.add(value)
+
+        restored = QuantileSketch.from_dict(sketch.to_dict())
+
+        assert restored.count == 4
+        assert restored.quantile(0.5) == sketch.quantile(0.5)
+
+    @parameterized.expand(
+        [
+            (0.0,),
+            (1.0,),
+        ]
+    )
+    def test_invalid_accuracy_raises_error(self, relative_accuracy: float) -> None:
+        with pytest.raises(ValueError):
+            QuantileSketch(relative_accuracy)
+
+    def test_invalid_quantile_raises_error(self) -> None:
+        with pytest.raises(ValueError):
+            QuantileSketch().quantile(1.5)
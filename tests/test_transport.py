@@ -0,0 +1,185 @@
+import gzip
+import json
+import urllib.error
+from collections.abc import Mapping
+from email.message import Message
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from parameterized import parameterized
+
+from jiken.client import JikenClient
+from jiken.exceptions import JikenAPIError, JikenAuthError
+from jiken.models import SearchCondition, TradePrice
+from jiken.transport import (
+    RecordingTransport,
+    ReplayTransport,
+    TransportResponse,
+    UrllibTransport,
+)
+
+URL = "https://example.com/XIT001?year=2024&area=13"
+RESPONSE_DATA = {"data": [{"TradePrice": "50000000", "Area": "100", "Period": "2024Q1"}]}
+
+
+def gzip_response() -> TransportResponse:
+    headers = Message()
+    headers["Content-Encoding"] = "gzip"
+    body = gzip.compress(json.dumps(RESPONSE_DATA).encode("utf-8"))
+    return TransportResponse(body=body, headers=headers)
+
+
+class FakeTransport:
+    def __init__(self, response: TransportResponse | Exception) -> None:
+        self.response = response
+        self.requests: list[tuple[str, dict[str, str]]] = []
+
+    def fetch(
+        self, url: str, headers: Mapping[str, str], timeout: float | None = None
+    ) -> TransportResponse:
+        self.requests.append((url, dict(headers)))
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+
+class TestUrllibTransport:
+    @patch("jiken.transport.urlopen")
+    def test_fetch_sends_headers(self, mock_urlopen: Mock) -> None:
+        mock_response = MagicMock()
+        mock_response.read.return_value = b"{}"
+        mock_response.__enter__.return_value = mock_response
+        mock_response.__exit__.return_value = None
+        mock_urlopen.return_value = mock_response
+
+        response = UrllibTransport().fetch(URL, {"Ocp-Apim-Subscription-Key": "test-key"})
+
+        request = mock_urlopen.call_args.args[0]
+        assert request.full_url == URL
+        assert request.get_header("Ocp-apim-subscription-key") == "test-key"
+        assert response.body == b"{}"
+
+
+class TestRecordAndReplay:
+    def test_replay_serves_recorded_response(self, tmp_path: Path) -> None:
+        recorder = RecordingTransport(tmp_path, transport=FakeTransport(gzip_response()))
+        recorder.fetch(URL, {"Ocp-Apim-Subscription-Key": "secret"})
+
+        response = ReplayTransport(tmp_path).fetch(URL, {})
+
+        assert response.body == gzip_response().body
+        assert response.headers.get("content-encoding") == "gzip"
+
+    def test_recording_does_not_store_api_key(self, tmp_path: Path) -> None:
+        recorder = RecordingTransport(tmp_path, transport=FakeTransport(gzip_response()))
+        recorder.fetch(URL, {"Ocp-Apim-Subscription-Key": "secret"})
+
+        for path in tmp_path.iterdir():
+            assert b"secret" not in path.read_bytes()
+
+    def test_replay_recorded_http_error(self, tmp_path: Path) -> None:
+        error = urllib.error.HTTPError(URL, 401, "Unauthorized", Message(), None)
+        recorder = RecordingTransport(tmp_path, transport=FakeTransport(error))
+
+        with pytest.raises(urllib.error.HTTPError):
+            recorder.fetch(URL, {})
+
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            ReplayTransport(tmp_path).fetch(URL, {})
+
+        assert exc_info.value.code == 401
+
+    def test_replay_missing_recording_raises_url_error(self, tmp_path: Path) -> None:
+        with pytest.raises(urllib.error.URLError) as exc_info:
+            ReplayTransport(tmp_path).fetch(URL, {})
+
+        assert "No recorded response" in str(exc_info.value.reason)
+
+    def test_replay_injects_latency(self, tmp_path: Path) -> None:
+        RecordingTransport(tmp_path, transport=FakeTransport(gzip_response())).fetch(URL, {})
+        delays: list[float] = []
+
+        replay = ReplayTransport(tmp_path, latency=0.05, jitter=0.01, seed=1, sleep=delays.append)
+        for _ in range(20):
+            replay.fetch(URL, {})
+
+        assert len(delays) == 20
+        assert all(delay >= 0.05 for delay in delays)
+        assert len(set(delays)) > 1
+
+    def test_replay_delay_beyond_timeout_raises_timeout_error(self, tmp_path: Path) -> None:
+        RecordingTransport(tmp_path, transport=FakeTransport(gzip_response())).fetch(URL, {})
+        delays: list[float] = []
+        replay = ReplayTransport(tmp_path, latency=5.0, sleep=delays.append)
+
+        with pytest.raises(TimeoutError):
+            replay.fetch(URL, {}, timeout=1.0)
+
+        assert delays == [1.0]
+
+    def test_replay_injects_errors(self, tmp_path: Path) -> None:
+        RecordingTransport(tmp_path, transport=FakeTransport(gzip_response())).fetch(URL, {})
+        replay = ReplayTransport(tmp_path, error_rate=0.5, error_status=429, seed=1)
+
+        statuses = []
+        for _ in range(100):
+            try:
+                replay.fetch(URL, {})
+                statuses.append(200)
+            except urllib.error.HTTPError as e:
+                statuses.append(e.code)
+
+        assert set(statuses) == {200, 429}
+
+    @parameterized.expand(
+        [
+            (-1.0, 0.0),
+            (0.0, -1.0),
+        ]
+    )
+    def test_replay_negative_delay_raises_error(self, latency: float, jitter: float) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            ReplayTransport("cassettes", latency=latency, jitter=jitter)
+
+        assert "Latency and jitter must not be negative" in str(exc_info.value)
+
+    @parameterized.expand(
+        [
+            (-0.1,),
+            (1.5,),
+        ]
+    )
+    def test_replay_invalid_error_rate_raises_error(self, error_rate: float) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            ReplayTransport("cassettes", error_rate=error_rate)
+
+        assert "Error rate must be between 0 and 1" in str(exc_info.value)
+
+
+class TestClientWithTransport:
+    def test_search_transactions_uses_transport(self) -> None:
+        transport = FakeTransport(gzip_response())
+        client = JikenClient(api_key="test-key", transport=transport)
+
+        transactions = client.search_transactions(SearchCondition(year=2024, area="13"))
+
+        assert transactions[0].transaction_price == TradePrice(amount_jpy=50000000)
+        url, headers = transport.requests[0]
+        assert "year=2024" in url
+        assert headers == {"Ocp-Apim-Subscription-Key": "test-key"}
+
+    def test_replayed_injected_error_maps_to_api_error(self, tmp_path: Path) -> None:
+        client = JikenClient(api_key="test-key", transport=ReplayTransport(tmp_path, error_rate=1))
+
+        with pytest.raises(JikenAPIError) as exc_info:
+            client.search_transactions(SearchCondition(year=2024, area="13"))
+
+        assert "status 503" in str(exc_info.value)
+
+    def test_transport_auth_error(self) -> None:
+        error = urllib.error.HTTPError(URL, 401, "Unauthorized", Message(), None)
+        client = JikenClient(api_key="invalid-key", transport=FakeTransport(error))
+
+        with pytest.raises(JikenAuthError):
+            client.search_transactions(SearchCondition(year=2024, area="13"))